@@ -1,5 +1,9 @@
 import os
+import atexit
+import logging
+import queue
 import secrets
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
@@ -8,8 +12,51 @@ from routes.upload import upload_bp
 from routes.analyze import analyze_bp
 from routes.train_simple import train_simple_bp
 from routes.predict_simple import predict_bp
+from utils.json_provider import OrjsonProvider
+
+class _LazyQueueHandler(QueueHandler):
+    """QueueHandler whose listener thread starts in the first process that logs through it
+
+    Threads don't survive fork (gunicorn preload_app), so each forked process that actually
+    logs starts its own listener; children that never log (e.g. pool workers) never start one.
+    """
+    
+    def __init__(self, handlers):
+        super().__init__(queue.SimpleQueue())
+        self._handlers = handlers
+        self._listener_pid = None
+    
+    def emit(self, record):
+        # Handler.handle holds self.lock (reinitialized after fork), so this check can't race
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+    
+    def _start_listener(self):
+        # Fresh queue: a forked child's copy may still hold records the parent never drained
+        self.queue = queue.SimpleQueue()
+        listener = QueueListener(self.queue, *self._handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        self._listener_pid = os.getpid()
+
+def configure_async_logging():
+    """Route root log records through a queue so handler I/O stays off request threads
+
+    Records are still formatted (tracebacks included) on the calling thread by
+    QueueHandler.prepare; only the write to the real handlers moves.
+    """
+    root = logging.getLogger()
+    root.handlers = [_LazyQueueHandler(root.handlers[:])]
+
+configure_async_logging()
 
 app = Flask(__name__)
+app.json_provider_class = OrjsonProvider
+app.json = OrjsonProvider(app)
+# Machine clients: no key sorting or pretty-printing (the JSON_* config keys are gone in Flask 2.3)
+app.json.sort_keys = False
+app.json.compact = True
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
@@ -1,17 +1,14 @@
 from flask import Flask
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from database.connection import create_session_registry
 from models.job_models import Base
 from services.job_manager import init_job_manager
 from routes.jobs_api import jobs_bp
 
 app = Flask(__name__)
 
-# Database setup
-engine = create_engine('sqlite:///jobs.db')
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
-db_session = Session()
+# Database setup: scoped_session gives the worker and each request thread its own Session
+db_session = create_session_registry('sqlite:///jobs.db')
+Base.metadata.create_all(db_session.get_bind())
 
 # Initialize job manager
 job_manager = init_job_manager(db_session)
@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
 import os
 
 db = SQLAlchemy()
@@ -23,4 +25,19 @@ def init_database(app):
     with app.app_context():
         db.create_all()
     
-    return db
\ No newline at end of file
+    return db
+
+SERVICE_POOL_OPTIONS = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_recycle': 300,
+    'pool_pre_ping': True
+}
+
+def create_session_registry(database_url=None):
+    """Thread-local session registry for background services (job managers, trackers, monitors)"""
+    database_url = database_url or os.getenv('DATABASE_URL', 'sqlite:///automl.db')
+    # SQLite's default pool does not take size options
+    options = {} if database_url.startswith('sqlite') else SERVICE_POOL_OPTIONS
+    engine = create_engine(database_url, **options)
+    return scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
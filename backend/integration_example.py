@@ -10,41 +10,50 @@ def train_model():
     tracker = GovernanceTracker(db_session)
     
     # Step 2: Register dataset (if not already registered)
-    with open(f'uploads/{filename}', 'rb') as f:
-        file_content = f.read()
+    # The upload route stores the content hash in a .sha256 sidecar; older uploads
+    # have none, so let register_dataset hash the file itself
+    file_path = f'uploads/{filename}'
+    try:
+        with open(f'{file_path}.sha256') as f:
+            content_hash = f.read().strip()
+    except FileNotFoundError:
+        content_hash = None
     
-    dataset_id = tracker.register_dataset(
-        filename=filename,
-        file_content=file_content,
-        metadata={'quality_score': 85, 'classification': 'internal'},
-        user_id='current_user'
-    )
-    
-    # Step 3: Start tracked training run
-    run_config = {
-        'run_id': str(uuid.uuid4()),
-        'target_column': data.get('target_column'),
-        'algorithm': 'RandomForestClassifier',
-        'hyperparameters': {'n_estimators': 100},
-        'random_seed': 42
-    }
-    
-    training_run_id = tracker.start_training_run(
-        dataset_id=dataset_id,
-        config=run_config,
-        user_id='current_user',
-        experiment_name='AutoML Training'
-    )
-    
-    # Step 4: Log decisions during training
-    tracker.log_decision(
-        training_run_id=training_run_id,
-        decision_type='algorithm_selection',
-        chosen_option='RandomForestClassifier',
-        reasoning='Best performance on similar datasets',
-        options_considered=['LogisticRegression', 'SVM', 'RandomForest'],
-        confidence=0.85
-    )
+    # Steps 2-4 share one commit
+    with tracker.transaction():
+        dataset_id = tracker.register_dataset(
+            filename=filename,
+            file_path=file_path,
+            metadata={'quality_score': 85, 'classification': 'internal'},
+            user_id='current_user',
+            content_hash=content_hash
+        )
+        
+        # Step 3: Start tracked training run
+        run_config = {
+            'run_id': str(uuid.uuid4()),
+            'target_column': data.get('target_column'),
+            'algorithm': 'RandomForestClassifier',
+            'hyperparameters': {'n_estimators': 100},
+            'random_seed': 42
+        }
+        
+        training_run_id = tracker.start_training_run(
+            dataset_id=dataset_id,
+            config=run_config,
+            user_id='current_user',
+            experiment_name='AutoML Training'
+        )
+        
+        # Step 4: Log decisions during training
+        tracker.log_decision(
+            training_run_id=training_run_id,
+            decision_type='algorithm_selection',
+            chosen_option='RandomForestClassifier',
+            reasoning='Best performance on similar datasets',
+            options_considered=['LogisticRegression', 'SVM', 'RandomForest'],
+            confidence=0.85
+        )
     
     # Step 5: Register model after training
     model_path = f'models/model_{training_run_id}.joblib'
@@ -74,20 +83,22 @@ def predict():
     confidence = 0.92
     
     # Log prediction for audit
+    # Rows are buffered and bulk-inserted, so the request_id is the trace key
     tracker = GovernanceTracker(db_session)
-    prediction_id = tracker.log_prediction(
+    request_id = str(uuid.uuid4())
+    tracker.log_prediction(
         model_id=model_id,
         input_features=input_features,
         prediction=prediction,
         confidence=confidence,
         user_id='current_user',
-        request_id=str(uuid.uuid4())
+        request_id=request_id
     )
     
     return jsonify({
         'prediction': prediction,
         'confidence': confidence,
-        'prediction_id': prediction_id
+        'request_id': request_id
     })
 
 # Step 7: Add governance endpoints
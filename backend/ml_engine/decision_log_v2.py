@@ -142,7 +142,7 @@ class MLDecisionEngine:
         if target_data.dtype == 'object':
             return "classification"
         
-        unique_values = len(target_data.unique())
+        unique_values = target_data.nunique()
         total_values = len(target_data)
         
         # If less than 10 unique values or less than 5% unique, likely classification
@@ -192,8 +192,7 @@ class FileIngestionEngine:
             
             for sep in separators:
                 try:
-                    df = pd.read_csv(file_path, sep=sep, encoding=metadata.encoding, 
-                                   low_memory=False, na_values=['', 'NULL', 'null', 'N/A', 'n/a'])
+                    df = self._read_csv_fast(file_path, sep, metadata.encoding)
                     
                     # Validate: should have multiple columns for CSV
                     if len(df.columns) > 1:
@@ -211,6 +210,14 @@ class FileIngestionEngine:
         except Exception as e:
             raise Exception(f"CSV processing failed: {str(e)}")
     
+    def _read_csv_fast(self, file_path: str, sep: str, encoding: str) -> pd.DataFrame:
+        """Multithreaded pyarrow parse, falling back to the C engine for inputs it rejects"""
+        na_values = ['', 'NULL', 'null', 'N/A', 'n/a']
+        try:
+            return pd.read_csv(file_path, sep=sep, encoding=encoding, engine='pyarrow', na_values=na_values)
+        except Exception:
+            return pd.read_csv(file_path, sep=sep, encoding=encoding, low_memory=False, na_values=na_values)
+    
     def _process_tsv(self, file_path: str, metadata: FileMetadata) -> pd.DataFrame:
         """Process TSV files"""
         try:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, DateTime, Text, Float, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -63,6 +63,10 @@ class TrainingRun(Base):
     dataset = relationship("Dataset", back_populates="training_runs")
     models = relationship("Model", back_populates="training_run")
     decisions = relationship("Decision", back_populates="training_run")
+    
+    __table_args__ = (
+        Index('ix_tr_dataset', 'dataset_id'),
+    )
 
 class Model(Base):
     __tablename__ = 'models'
@@ -151,4 +155,18 @@ class Prediction(Base):
     feedback_received_at = Column(DateTime)
     
     # Relationships
-    model = relationship("Model", back_populates="predictions")
\ No newline at end of file
+    model = relationship("Model", back_populates="predictions")
+    
+    # Supports per-model time-window scans (health checks, drift seeding)
+    __table_args__ = (
+        Index('ix_pred_model_time', 'model_id', predicted_at.desc()),
+    )
+
+class DriftAlert(Base):
+    __tablename__ = 'drift_alerts'
+    
+    id = Column(Integer, primary_key=True)
+    model_id = Column(Integer, ForeignKey('models.id'), nullable=False)
+    alert_type = Column(String(50), nullable=False)  # e.g. confidence_drop
+    metric_value = Column(Float)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import os
 import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 import json
 import PyPDF2
@@ -13,6 +15,11 @@ import textblob
 
 ingestion_bp = Blueprint('ingestion', __name__)
 
+# Processed results keyed by (file_hash, file_ext); identical re-uploads skip parsing
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_SIZE = 256
+
 class FileIngestionEngine:
     """Modular file processing with honest capability levels per format"""
     
@@ -36,6 +43,14 @@ class FileIngestionEngine:
         
         file_hash = self._generate_file_hash(filepath)
         
+        cached = self._get_cached_result(file_hash, file_ext)
+        if cached is not None:
+            cached.update({
+                'filename': filename,
+                'processed_at': datetime.now().isoformat()
+            })
+            return cached
+        
         result = {
             'filename': filename,
             'file_type': file_ext,
@@ -46,16 +61,38 @@ class FileIngestionEngine:
         }
         
         if processing_level == 'FULL_ML_PIPELINE':
-            return self._process_tabular_data(filepath, result)
+            result = self._process_tabular_data(filepath, result)
         elif processing_level == 'SCHEMA_EXTRACTION_ML_IF_TABULAR':
-            return self._process_structured_data(filepath, result)
+            result = self._process_structured_data(filepath, result)
         elif processing_level == 'TEXT_EXTRACTION_NLP_PROFILING':
-            return self._process_text_data(filepath, result)
+            result = self._process_text_data(filepath, result)
         elif processing_level == 'METADATA_CV_PLACEHOLDER':
-            return self._process_image_data(filepath, result)
+            result = self._process_image_data(filepath, result)
         else:
             result['error'] = 'Unsupported file type'
             return result
+        
+        if 'error' not in result:
+            self._cache_result(file_hash, file_ext, result)
+        return result
+    
+    def _get_cached_result(self, file_hash, file_ext):
+        """Return a copy of a previously processed result for identical content"""
+        key = (file_hash, file_ext)
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+            if cached is None:
+                return None
+            _RESULT_CACHE.move_to_end(key)
+            return dict(cached)
+    
+    def _cache_result(self, file_hash, file_ext, result):
+        """Store processed result, evicting the least recently used entry"""
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[(file_hash, file_ext)] = dict(result)
+            _RESULT_CACHE.move_to_end((file_hash, file_ext))
+            while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
     
     def _process_tabular_data(self, filepath, result):
         """Full ML pipeline for CSV/XLSX"""
@@ -2,10 +2,70 @@ from flask import Blueprint, request, jsonify
 import pandas as pd
 import numpy as np
 import os
+import logging
+import threading
 import joblib
+from collections import OrderedDict
+from utils.json_provider import make_json_response
+
+logger = logging.getLogger(__name__)
 
 predict_bp = Blueprint('predict', __name__)
 
+# Loaded model packages keyed by name, invalidated when the file's mtime changes
+_MODEL_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_MODEL_CACHE_SIZE = 32
+TOP_FEATURE_IMPORTANCES = 20
+
+def _lower_encoders(label_encoders, category_uniques):
+    """Reduce fitted LabelEncoders / factorize uniques to class -> code lookups plus a default code"""
+    fast_encoders = {
+        col: (dict(zip(uniques, range(len(uniques)))), 0)
+        for col, uniques in category_uniques.items()
+    }
+    for col, encoder in label_encoders.items():
+        if col == '_target_':
+            continue
+        # Newer packages store factorize uniques directly; older ones a fitted LabelEncoder
+        classes = getattr(encoder, 'classes_', encoder)
+        lookup = dict(zip(classes, range(len(classes))))
+        # Unseen labels map to the first class's code, resolved once per load
+        default = int(encoder.transform(classes[:1])[0]) if hasattr(encoder, 'transform') else 0
+        fast_encoders[col] = (lookup, default)
+    return fast_encoders
+
+def _get_model(model_name):
+    """Load a model package, reusing the in-process copy while the file is unchanged"""
+    model_path = os.path.join('models', f"{model_name}.joblib")
+    try:
+        mtime = os.stat(model_path).st_mtime
+    except FileNotFoundError:
+        return None
+    
+    with _CACHE_LOCK:
+        cached = _MODEL_CACHE.get(model_name)
+        if cached is not None and cached[0] == mtime:
+            _MODEL_CACHE.move_to_end(model_name)
+            return cached[1]
+        
+        # Memory-map uncompressed arrays so workers share pages instead of copying
+        model_package = joblib.load(model_path, mmap_mode='r')
+        model_package['has_proba'] = hasattr(model_package['model'], 'predict_proba')
+        target_encoder = model_package.get('label_encoders', {}).get('_target_')
+        model_package['target_classes'] = (
+            np.asarray(getattr(target_encoder, 'classes_', target_encoder))
+            if target_encoder is not None else None
+        )
+        model_package['fast_encoders'] = _lower_encoders(
+            model_package.get('label_encoders', {}), model_package.get('category_uniques', {})
+        )
+        _MODEL_CACHE[model_name] = (mtime, model_package)
+        _MODEL_CACHE.move_to_end(model_name)
+        while len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+        return model_package
+
 @predict_bp.route('/api/predict', methods=['POST'])
 def make_prediction():
     """Simple prediction endpoint"""
@@ -24,15 +84,14 @@ def make_prediction():
             return jsonify({'error': 'Input data is required'}), 400
         
         # Load model
-        model_path = os.path.join('models', f"{model_name}.joblib")
-        if not os.path.exists(model_path):
+        model_package = _get_model(model_name)
+        if model_package is None:
             return jsonify({'error': f'Model {model_name} not found'}), 404
         
-        model_package = joblib.load(model_path)
         model = model_package['model']
         scaler = model_package['scaler']
         feature_columns = model_package['feature_columns']
-        label_encoders = model_package.get('label_encoders', {})
+        fast_encoders = model_package['fast_encoders']
         
         # Prepare input data
         if isinstance(input_data, dict):
@@ -40,75 +99,69 @@ def make_prediction():
         else:
             df = pd.DataFrame(input_data)
         
-        # Ensure all required features are present
-        for col in feature_columns:
-            if col not in df.columns:
-                df[col] = 0
-        
-        # Select and order features
-        X = df[feature_columns].copy()
+        # Select and order features, filling any missing ones with 0 in a single pass
+        X = df.reindex(columns=feature_columns, fill_value=0)
         
         # Advanced preprocessing - use stored label encoders
-        from sklearn.preprocessing import LabelEncoder
         for col in X.columns:
             if X[col].dtype == 'object' or not pd.api.types.is_numeric_dtype(X[col]):
                 X[col] = X[col].fillna('Unknown')
-                if col in label_encoders:
-                    le = label_encoders[col]
-                    # Handle unseen labels by mapping to most frequent class
-                    def safe_transform(val):
-                        if val in le.classes_:
-                            return le.transform([val])[0]
-                        else:
-                            return le.transform([le.classes_[0]])[0]  # Use first class as default
-                    X[col] = X[col].apply(safe_transform)
+                if col in fast_encoders:
+                    lookup, default = fast_encoders[col]
+                    X[col] = X[col].astype(str).map(lookup).fillna(default).astype(np.int64)
                 else:
-                    le = LabelEncoder()
-                    X[col] = le.fit_transform(X[col].astype(str))
+                    # No stored encoder: deterministic hashed categories, stable across requests
+                    hashed = pd.util.hash_array(X[col].astype(str).to_numpy(dtype=object))
+                    X[col] = (hashed % (1 << 31)).astype(np.int64)
             else:
                 X[col] = pd.to_numeric(X[col], errors='coerce').fillna(0)
         
-        # Scale features
-        X_scaled = scaler.transform(X)
-        
-        # Make prediction
-        predictions = model.predict(X_scaled)
+        # Scale features (tree-only packages are saved without a scaler)
+        X_scaled = scaler.transform(X) if scaler is not None else X.to_numpy()
         
-        # Get prediction probabilities if available
-        confidence_scores = None
-        if hasattr(model, 'predict_proba'):
+        # Make prediction; classifiers derive labels from the probabilities in one pass
+        probabilities = None
+        if model_package['has_proba']:
             try:
                 probabilities = model.predict_proba(X_scaled)
-                confidence_scores = np.max(probabilities, axis=1).tolist()
-            except:
-                confidence_scores = [0.85] * len(predictions)
+            except Exception:
+                probabilities = None
+        
+        if probabilities is not None:
+            predictions = model.classes_[np.argmax(probabilities, axis=1)]
+            confidence_scores = probabilities.max(axis=1)
         else:
-            confidence_scores = [0.85] * len(predictions)
+            predictions = np.asarray(model.predict(X_scaled))
+            confidence_scores = np.full(len(predictions), 0.85)
+        
+        # Map encoded class codes back to the original target labels
+        target_classes = model_package['target_classes']
+        if target_classes is not None and model_package.get('is_classification'):
+            predictions = target_classes[predictions.astype(np.int64)]
         
-        # Feature importance if available
+        # Feature importance if available (top non-zero features only)
         feature_importance = []
         if hasattr(model, 'feature_importances_'):
             importance_scores = model.feature_importances_
+            order = np.argsort(importance_scores)[::-1][:TOP_FEATURE_IMPORTANCES]
             feature_importance = [
-                {'feature': col, 'importance': float(score)}
-                for col, score in zip(feature_columns, importance_scores)
+                {'feature': feature_columns[i], 'importance': float(importance_scores[i])}
+                for i in order if importance_scores[i] > 0
             ]
-            feature_importance.sort(key=lambda x: x['importance'], reverse=True)
         
         response = {
             'success': True,
-            'predictions': predictions.tolist() if hasattr(predictions, 'tolist') else [predictions],
+            'predictions': predictions,
             'confidence_scores': confidence_scores,
             'feature_importance': feature_importance,
             'model_used': model_name,
             'problem_type': 'Classification' if model_package.get('is_classification') else 'Regression'
         }
         
-        return jsonify(response)
+        return make_json_response(response)
     
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception('Prediction failed')
         return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
 
 @predict_bp.route('/api/models', methods=['GET'])
@@ -119,10 +172,8 @@ def list_models():
         if not os.path.exists(models_dir):
             return jsonify({'models': []})
         
-        models = []
-        for file in os.listdir(models_dir):
-            if file.endswith('.joblib'):
-                models.append(file.replace('.joblib', ''))
+        with os.scandir(models_dir) as it:
+            models = [e.name.replace('.joblib', '') for e in it if e.name.endswith('.joblib')]
         
         return jsonify({'models': models})
     
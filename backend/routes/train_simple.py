@@ -5,19 +5,169 @@ import numpy as np
 import os
 import joblib
 from datetime import datetime
-from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold, KFold
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingClassifier, GradientBoostingRegressor, ExtraTreesClassifier, ExtraTreesRegressor, VotingClassifier, VotingRegressor
-from sklearn.preprocessing import StandardScaler, LabelEncoder, RobustScaler
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, mean_squared_error, r2_score, mean_absolute_error
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split, StratifiedKFold, KFold
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor, ExtraTreesClassifier, ExtraTreesRegressor
+from sklearn.metrics import get_scorer, accuracy_score, precision_score, recall_score, f1_score, mean_squared_error, r2_score, mean_absolute_error
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression, mutual_info_classif, mutual_info_regression
 from sklearn.impute import SimpleImputer
 import hashlib
+import json
+import threading
 import time
+from functools import partial
+from itertools import islice
 import warnings
-warnings.filterwarnings('ignore')
+from contextlib import contextmanager
+from utils.helpers import read_csv_fast
 
 train_simple_bp = Blueprint('train_simple', __name__)
 SAMPLE_THRESHOLD = 50000
+CSV_PROBE_ROWS = 10000
+MI_MAX_ROWS = 5000
+MI_MAX_FEATURES = 50
+DEFAULT_MODEL_LIST_LIMIT = 100
+TRAINING_CACHE_INDEX = os.path.join('models', 'cache_index.json')
+_TRAINING_CACHE_LOCK = threading.Lock()
+METADATA_KEYS = ('model_name', 'created_at', 'best_model_name', 'target_column', 'training_time',
+                 'feature_columns', 'is_classification', 'all_results', 'dataset_info')
+
+class FittedVotingClassifier:
+    """Soft-voting ensemble over classifiers that are already fitted on the same target"""
+    
+    def __init__(self, estimators):
+        self.estimators = estimators
+        self.classes_ = estimators[0][1].classes_
+    
+    def predict_proba(self, X):
+        return np.mean([model.predict_proba(X) for _, model in self.estimators], axis=0)
+    
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+class FittedVotingRegressor:
+    """Averaging ensemble over regressors that are already fitted on the same target"""
+    
+    def __init__(self, estimators):
+        self.estimators = estimators
+    
+    def predict(self, X):
+        return np.mean([model.predict(X) for _, model in self.estimators], axis=0)
+
+def _single_threaded_params(model):
+    """Params that pin a candidate to one core while it runs inside the CV pool"""
+    return {'n_jobs': 1} if 'n_jobs' in model.get_params() else {}
+
+@contextmanager
+def _quiet_training_warnings():
+    """Silence the sklearn/pandas user and deprecation chatter emitted while fitting candidates"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=UserWarning)
+        warnings.simplefilter('ignore', category=FutureWarning)
+        yield
+
+def _fit_score(model, X, y, train_idx, val_idx, scoring):
+    """Fit one CV fold and score it; returns (score, error), with a NaN score and the message on failure"""
+    try:
+        # Runs in a loky worker, so the parent's warning filters do not apply here
+        with _quiet_training_warnings():
+            model.fit(X[train_idx], y[train_idx])
+            return get_scorer(scoring)(model, X[val_idx], y[val_idx]), None
+    except Exception as e:
+        return np.nan, str(e)
+
+def _load_csv(filepath):
+    """Load a training CSV; returns (df, total_rows), total_rows set only when streamed"""
+    # Estimate the row count from the average size of the header plus a probe of lines
+    with open(filepath, 'rb') as f:
+        probe = list(islice(f, CSV_PROBE_ROWS + 1))
+    avg_line_bytes = sum(map(len, probe)) / max(len(probe), 1)
+    estimated_rows = os.path.getsize(filepath) / max(avg_line_bytes, 1)
+    
+    if estimated_rows <= SAMPLE_THRESHOLD * 2:
+        # Multi-threaded Arrow reader; date/time columns stay strings as at predict time
+        return read_csv_fast(filepath), None
+    
+    # Reservoir sample: tag every row with a random key and keep the smallest keys,
+    # so the full frame is never held in memory
+    rng = np.random.default_rng(42)
+    sample, sample_keys, total_rows = None, np.empty(0), 0
+    for chunk in pd.read_csv(filepath, chunksize=SAMPLE_THRESHOLD):
+        total_rows += len(chunk)
+        keys = rng.random(len(chunk))
+        if sample is not None:
+            chunk = pd.concat([sample, chunk], ignore_index=True)
+            keys = np.concatenate([sample_keys, keys])
+        if len(chunk) > SAMPLE_THRESHOLD:
+            keep = np.argpartition(keys, SAMPLE_THRESHOLD)[:SAMPLE_THRESHOLD]
+            chunk, keys = chunk.iloc[keep].reset_index(drop=True), keys[keep]
+        sample, sample_keys = chunk, keys
+    return sample, total_rows
+
+def _training_cache_key(filepath, config):
+    """Key a training run by dataset content plus its configuration"""
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            content_hash = hashlib.file_digest(f, 'sha1').hexdigest()
+        else:
+            h = hashlib.sha1()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+            content_hash = h.hexdigest()
+    config_hash = hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()
+    return content_hash + config_hash
+
+def _read_training_cache_index():
+    try:
+        with open(TRAINING_CACHE_INDEX) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _load_cached_training(cache_key):
+    """Metadata of a model already trained for this key, if its files still exist"""
+    model_name = _read_training_cache_index().get(cache_key)
+    if not model_name:
+        return None
+    
+    model_path = os.path.join('models', f"{model_name}.joblib")
+    meta_path = model_path.replace('.joblib', '.meta.json')
+    if not (os.path.exists(model_path) and os.path.exists(meta_path)):
+        return None
+    
+    with open(meta_path) as f:
+        return json.load(f)
+
+def _record_training(cache_key, model_name):
+    """Map a training cache key to its model, replacing the index atomically"""
+    with _TRAINING_CACHE_LOCK:
+        index = _read_training_cache_index()
+        index[cache_key] = model_name
+        tmp_path = f"{TRAINING_CACHE_INDEX}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, TRAINING_CACHE_INDEX)
+
+def _training_response(metadata):
+    """Build the /api/train response from a model's metadata"""
+    results = metadata['all_results']
+    best_result = next(r for r in results if r['model'] == metadata['best_model_name'])
+    
+    return {
+        'success': True,
+        'model_name': metadata['model_name'],
+        'best_model': metadata['best_model_name'],
+        'performance_metrics': best_result,
+        'all_models': results,
+        'training_time': round(metadata['training_time'], 2),
+        'problem_type': 'Classification' if metadata['is_classification'] else 'Regression',
+        'dataset_info': {
+            'rows': metadata['dataset_info']['training_rows'],
+            'features': len(metadata['feature_columns']),
+            'target': metadata['target_column']
+        }
+    }
 
 def emit_progress(message, progress, socketio=None):
     """Emit training progress via WebSocket"""
@@ -77,11 +227,21 @@ def train_model():
         if not os.path.exists(filepath):
             return jsonify({'error': f'File not found: {filename}'}), 404
         
+        # Identical dataset content and config: reuse the model trained last time
+        cache_key = _training_cache_key(filepath, config)
+        cached = _load_cached_training(cache_key)
+        if cached is not None:
+            emit_progress("Reusing model trained on identical data", 100, socketio)
+            response = _training_response(cached)
+            response['cached'] = True
+            return jsonify(response)
+        
         emit_progress("Loading dataset...", 10, socketio)
         
         # Load data
+        streamed_rows = None
         if filename.endswith('.csv'):
-            df = pd.read_csv(filepath)
+            df, streamed_rows = _load_csv(filepath)
         elif filename.endswith(('.xlsx', '.xls')):
             df = pd.read_excel(filepath, engine='openpyxl')
         else:
@@ -99,41 +259,50 @@ def train_model():
         emit_progress("Analyzing data structure...", 15, socketio)
         
         # Smart sampling for large datasets
-        original_size = len(df)
+        original_size = streamed_rows if streamed_rows is not None else len(df)
         if len(df) > SAMPLE_THRESHOLD:
             emit_progress(f"Smart sampling ({len(df)} rows)...", 18, socketio)
             sample_size = min(SAMPLE_THRESHOLD, len(df))
-            df = df.sample(n=sample_size, random_state=42)
+            # Draw row positions directly instead of permuting the whole index
+            rng = np.random.default_rng(42)
+            idx = rng.choice(len(df), size=sample_size, replace=False)
+            df = df.iloc[idx].reset_index(drop=True)
             emit_progress(f"Using {len(df)} samples", 20, socketio)
         
         target_col = df.columns[-1]
-        feature_cols = df.columns[:-1].tolist()
         
-        X = df[feature_cols].copy()
-        y = df[target_col].copy()
+        # drop() already yields a new, independently writable frame, and y is only
+        # ever rebound (never modified in place), so neither needs an extra copy
+        X = df.drop(columns=target_col)
+        y = df[target_col]
         
         emit_progress("Preprocessing features...", 25, socketio)
         
-        # Optimized preprocessing with better imputation
+        # Optimized preprocessing with better imputation; split column kinds once
         label_encoders = {}
-        for col in X.columns:
-            if pd.api.types.is_datetime64_any_dtype(X[col]):
-                X[col] = pd.to_numeric(X[col].astype('int64') / 10**9, errors='coerce')
-                X[col] = X[col].fillna(X[col].median())
-            elif X[col].dtype == 'object' or not pd.api.types.is_numeric_dtype(X[col]):
-                # Use mode for categorical
-                mode_val = X[col].mode()[0] if len(X[col].mode()) > 0 else 'Unknown'
-                X[col] = X[col].fillna(mode_val)
-                le = LabelEncoder()
-                X[col] = le.fit_transform(X[col].astype(str))
-                label_encoders[col] = le
-            else:
-                # Use median for numerical
-                X[col] = X[col].fillna(X[col].median())
-        
-        # Ensure all numeric
-        for col in X.columns:
-            X[col] = pd.to_numeric(X[col], errors='coerce').fillna(0)
+        dt_cols = X.select_dtypes(include=['datetime', 'datetimetz']).columns
+        num_cols = X.select_dtypes(include=[np.number, 'bool']).columns
+        cat_cols = X.columns.difference(num_cols.union(dt_cols), sort=False)
+        
+        for col in dt_cols:
+            X[col] = pd.to_numeric(X[col].astype('int64') / 10**9, errors='coerce')
+        
+        # Use mode for categorical, computed for all columns in one call
+        mode_frame = X[cat_cols].mode()
+        modes = mode_frame.iloc[0].to_dict() if len(mode_frame) > 0 else {}
+        
+        for col in cat_cols:
+            # factorize uniques act as the encoder
+            mode_val = modes.get(col)
+            if pd.isna(mode_val):
+                mode_val = 'Unknown'
+            codes, uniques = pd.factorize(X[col].fillna(mode_val).astype(str))
+            X[col] = codes
+            label_encoders[col] = np.asarray(uniques)
+        
+        # Use median for numerical (and converted datetime) columns; 0 if a column has none
+        fill_cols = num_cols.union(dt_cols, sort=False)
+        X[fill_cols] = X[fill_cols].fillna(X[fill_cols].median()).fillna(0)
         
         # Determine problem type
         is_classification = False
@@ -141,51 +310,54 @@ def train_model():
             y = pd.to_numeric(y.astype('int64') / 10**9, errors='coerce').fillna(0)
         elif y.dtype == 'object' or not pd.api.types.is_numeric_dtype(y):
             is_classification = True
-            y = y.fillna(y.mode()[0] if len(y.mode()) > 0 else 'Unknown')
-            le_target = LabelEncoder()
-            y = le_target.fit_transform(y.astype(str))
-            label_encoders['_target_'] = le_target
+            y_mode = y.mode()
+            y = y.fillna(y_mode[0] if len(y_mode) > 0 else 'Unknown')
+            y, target_uniques = pd.factorize(y.astype(str))
+            label_encoders['_target_'] = np.asarray(target_uniques)
         else:
-            unique_values = len(y.unique())
+            unique_values = y.nunique(dropna=True)
             if unique_values < 10 or (unique_values / len(y)) < 0.05:
                 is_classification = True
             y = pd.to_numeric(y, errors='coerce').fillna(y.median())
         
         emit_progress(f"Problem type: {'Classification' if is_classification else 'Regression'}", 30, socketio)
         
-        # Smart feature selection with mutual information
-        if len(X.columns) > feature_selection_k:
+        # Smart feature selection: F-test ranking by default; the k-NN based mutual
+        # information estimator is only affordable on small datasets
+        feature_names = X.columns.tolist()
+        if len(feature_names) > feature_selection_k:
             emit_progress("Selecting top features...", 35, socketio)
-            if is_classification:
-                selector = SelectKBest(mutual_info_classif, k=min(feature_selection_k, len(X.columns)))
+            if len(X) < MI_MAX_ROWS and len(feature_names) < MI_MAX_FEATURES:
+                mi_func = mutual_info_classif if is_classification else mutual_info_regression
+                score_func = partial(mi_func, n_neighbors=3, random_state=42)
             else:
-                selector = SelectKBest(mutual_info_regression, k=min(feature_selection_k, len(X.columns)))
-            X = pd.DataFrame(selector.fit_transform(X, y), columns=X.columns[selector.get_support()])
+                score_func = f_classif if is_classification else f_regression
+            selector = SelectKBest(score_func, k=min(feature_selection_k, len(feature_names)))
+            # Keep the selected matrix as an ndarray; only the names need tracking
+            X = selector.fit_transform(X, y)
+            feature_names = [feature_names[i] for i in selector.get_support(indices=True)]
         
         # Optimized train/test split
         test_size = 0.15
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42, stratify=y if is_classification else None)
         
-        emit_progress("Scaling features...", 40, socketio)
-        
-        # Use RobustScaler for better outlier handling
-        scaler = RobustScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        # Every candidate is a tree ensemble, which is scale-invariant, so features
+        # go to the models unscaled (saves a full copy of X). Convert once to the
+        # contiguous float32 the tree builders use internally, so no fit re-copies it
+        X_train = np.ascontiguousarray(X_train, dtype=np.float32)
+        X_test = np.ascontiguousarray(X_test, dtype=np.float32)
         
         # Optimized model training
         emit_progress("Training models...", 45, socketio)
         
         if is_classification:
             models_to_try = [
-                ('Random Forest', RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, min_samples_split=2, min_samples_leaf=1, max_features='sqrt', n_jobs=-1, random_state=42, class_weight='balanced')),
-                ('Gradient Boosting', GradientBoostingClassifier(n_estimators=n_estimators, learning_rate=0.1, max_depth=5, subsample=0.8, n_jobs=-1, random_state=42)),
+                ('Hist Gradient Boosting', HistGradientBoostingClassifier(max_iter=n_estimators, max_depth=max_depth, learning_rate=0.1, random_state=42, class_weight='balanced')),
                 ('Extra Trees', ExtraTreesClassifier(n_estimators=n_estimators, max_depth=max_depth, min_samples_split=2, min_samples_leaf=1, n_jobs=-1, random_state=42, class_weight='balanced'))
             ]
         else:
             models_to_try = [
-                ('Random Forest', RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth, min_samples_split=2, min_samples_leaf=1, max_features='sqrt', n_jobs=-1, random_state=42)),
-                ('Gradient Boosting', GradientBoostingRegressor(n_estimators=n_estimators, learning_rate=0.1, max_depth=5, subsample=0.8, n_jobs=-1, random_state=42)),
+                ('Hist Gradient Boosting', HistGradientBoostingRegressor(max_iter=n_estimators, max_depth=max_depth, learning_rate=0.1, random_state=42)),
                 ('Extra Trees', ExtraTreesRegressor(n_estimators=n_estimators, max_depth=max_depth, min_samples_split=2, min_samples_leaf=1, n_jobs=-1, random_state=42))
             ]
         
@@ -195,24 +367,52 @@ def train_model():
         best_model_name = None
         trained_models = []
         
-        # Parallel training with optimized CV
+        # Stratified CV for classification
+        if is_classification:
+            cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=42)
+        else:
+            cv = KFold(n_splits=cv_folds, shuffle=True, random_state=42)
+        
+        # Cross-validate every (model, fold) pair in one pool so slow and fast
+        # algorithms overlap; candidates run single-threaded to avoid oversubscription
+        emit_progress(f"CV evaluation for {len(models_to_try)} models...", 48, socketio)
+        scoring = 'accuracy' if is_classification else 'r2'
+        y_train_arr = np.asarray(y_train)
+        splits = list(cv.split(X_train, y_train_arr))  # shared by every candidate
+        tasks = [
+            (name, clone(model).set_params(**_single_threaded_params(model)), train_idx, val_idx)
+            for name, model in models_to_try
+            for train_idx, val_idx in splits
+        ]
+        # Workers receive the full arrays plus fold indices: joblib dumps arrays above
+        # max_nbytes to one memmap that every worker shares, instead of pickling a
+        # sliced copy of X per task
+        fold_scores = Parallel(n_jobs=-1, backend='loky', max_nbytes='1M', mmap_mode='r')(
+            delayed(_fit_score)(mdl, X_train, y_train_arr, tr, va, scoring)
+            for _, mdl, tr, va in tasks
+        )
+        cv_results = {}
+        cv_errors = {}
+        for (name, _, _, _), (fold_score, fold_error) in zip(tasks, fold_scores):
+            cv_results.setdefault(name, []).append(fold_score)
+            if fold_error is not None:
+                cv_errors.setdefault(name, fold_error)
+        
         for idx, (name, model) in enumerate(models_to_try):
             progress = 50 + (idx * 12)
             emit_progress(f"Training {name}...", progress, socketio)
             
             try:
-                # Stratified CV for classification
-                if is_classification:
-                    cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=42)
-                else:
-                    cv = KFold(n_splits=cv_folds, shuffle=True, random_state=42)
-                
-                emit_progress(f"CV evaluation for {name}...", progress + 2, socketio)
-                cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=cv, scoring='accuracy' if is_classification else 'r2', n_jobs=-1)
+                cv_scores = np.array(cv_results[name])
+                if name in cv_errors:
+                    raise ValueError(f'cross-validation failed: {cv_errors[name]}')
+                if np.isnan(cv_scores).any():
+                    raise ValueError('cross-validation produced an undefined score')
                 
                 emit_progress(f"Training {name} on full dataset...", progress + 5, socketio)
-                model.fit(X_train_scaled, y_train)
-                y_pred = model.predict(X_test_scaled)
+                with _quiet_training_warnings():
+                    model.fit(X_train, y_train)
+                    y_pred = model.predict(X_test)
                 
                 trained_models.append((name, model))
             except Exception as e:
@@ -265,13 +465,13 @@ def train_model():
         if use_ensemble and len(trained_models) >= 2:
             emit_progress("Creating ensemble model...", 88, socketio)
             try:
+                # Vote with the candidates fitted above rather than refitting them
                 if is_classification:
-                    ensemble = VotingClassifier(estimators=trained_models, voting='soft', n_jobs=-1)
+                    ensemble = FittedVotingClassifier(trained_models)
                 else:
-                    ensemble = VotingRegressor(estimators=trained_models, n_jobs=-1)
+                    ensemble = FittedVotingRegressor(trained_models)
                 
-                ensemble.fit(X_train_scaled, y_train)
-                y_pred_ensemble = ensemble.predict(X_test_scaled)
+                y_pred_ensemble = ensemble.predict(X_test)
                 
                 if is_classification:
                     ensemble_score = accuracy_score(y_test, y_pred_ensemble)
@@ -302,9 +502,9 @@ def train_model():
         
         model_package = {
             'model': best_model,
-            'scaler': scaler,
+            'scaler': None,
             'label_encoders': label_encoders,
-            'feature_columns': list(X.columns),
+            'feature_columns': feature_names,
             'target_column': target_col,
             'model_name': model_name,
             'created_at': datetime.now().isoformat(),
@@ -315,34 +515,25 @@ def train_model():
             'dataset_info': {
                 'rows': original_size,
                 'training_rows': len(df),
-                'features': len(X.columns),
+                'features': len(feature_names),
                 'filename': filename,
                 'training_mode': training_mode,
                 'cv_folds': cv_folds
             }
         }
         
-        joblib.dump(model_package, model_path)
+        # Uncompressed so predict_simple can memory-map the model arrays
+        joblib.dump(model_package, model_path, compress=0, protocol=5)
+        
+        # Sidecar metadata so list_models never has to unpickle the estimator
+        with open(model_path.replace('.joblib', '.meta.json'), 'w') as f:
+            json.dump({key: model_package[key] for key in METADATA_KEYS}, f, default=str)
         
         emit_progress("Training complete!", 100, socketio)
         
         # Prepare response
-        best_result = next(r for r in results if r['model'] == best_model_name)
-        
-        response = {
-            'success': True,
-            'model_name': model_name,
-            'best_model': best_model_name,
-            'performance_metrics': best_result,
-            'all_models': results,
-            'training_time': round(training_time, 2),
-            'problem_type': 'Classification' if is_classification else 'Regression',
-            'dataset_info': {
-                'rows': len(df),
-                'features': len(X.columns),
-                'target': target_col
-            }
-        }
+        response = _training_response(model_package)
+        _record_training(cache_key, model_name)
         
         return jsonify(response)
         
@@ -359,33 +550,45 @@ def list_models():
         if not os.path.exists(models_dir):
             return jsonify({'models': []})
         
+        limit = request.args.get('limit', DEFAULT_MODEL_LIST_LIMIT, type=int)
+        
+        # Newest first by file mtime, so only the requested page is ever opened
+        with os.scandir(models_dir) as it:
+            entries = [e for e in it if e.name.endswith('.joblib')]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        
         models = []
-        for file in os.listdir(models_dir):
-            if file.endswith('.joblib'):
-                try:
-                    model_path = os.path.join(models_dir, file)
-                    model_package = joblib.load(model_path)
-                    
-                    # Get first result for performance metrics
-                    all_results = model_package.get('all_results', [])
-                    performance = all_results[0] if all_results else {}
-                    
-                    models.append({
-                        'name': model_package.get('model_name', file.replace('.joblib', '')),
-                        'created_at': model_package.get('created_at', 'unknown'),
-                        'algorithm': model_package.get('best_model_name', 'unknown'),
-                        'performance': performance,
-                        'target_column': model_package.get('target_column', 'unknown'),
-                        'training_time': model_package.get('training_time', 0),
-                        'feature_columns': model_package.get('feature_columns', []),
-                        'problem_type': 'Classification' if model_package.get('is_classification') else 'Regression',
-                        'dataset_info': model_package.get('dataset_info', {})
-                    })
-                except Exception as e:
-                    print(f"Error loading model {file}: {e}")
-                    continue
-        
-        models.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        for entry in entries[:limit]:
+            file = entry.name
+            try:
+                meta_path = entry.path.replace('.joblib', '.meta.json')
+                
+                if os.path.exists(meta_path):
+                    with open(meta_path) as f:
+                        model_package = json.load(f)
+                else:
+                    # Legacy model saved without sidecar metadata
+                    model_package = joblib.load(entry.path)
+                
+                # Get first result for performance metrics
+                all_results = model_package.get('all_results', [])
+                performance = all_results[0] if all_results else {}
+                
+                models.append({
+                    'name': model_package.get('model_name', file.replace('.joblib', '')),
+                    'created_at': model_package.get('created_at', 'unknown'),
+                    'algorithm': model_package.get('best_model_name', 'unknown'),
+                    'performance': performance,
+                    'target_column': model_package.get('target_column', 'unknown'),
+                    'training_time': model_package.get('training_time', 0),
+                    'feature_columns': model_package.get('feature_columns', []),
+                    'problem_type': 'Classification' if model_package.get('is_classification') else 'Regression',
+                    'dataset_info': model_package.get('dataset_info', {})
+                })
+            except Exception as e:
+                print(f"Error loading model {file}: {e}")
+                continue
+        
         return jsonify({'models': models})
         
     except Exception as e:
@@ -401,6 +604,9 @@ def delete_model(model_name):
             return jsonify({'error': 'Model not found'}), 404
         
         os.remove(model_path)
+        meta_path = model_path.replace('.joblib', '.meta.json')
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
         return jsonify({'success': True, 'message': f'Model {model_name} deleted'})
         
     except Exception as e:
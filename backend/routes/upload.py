@@ -1,16 +1,48 @@
 import os
 import logging
-from flask import Blueprint, request, jsonify
+import gzip
+import hashlib
+import secrets
+import tempfile
+import threading
+import time
+import orjson
+from pathlib import PurePath
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Response, request, jsonify
 from werkzeug.utils import secure_filename
 from ml_engine.file_ingestion import FileIngestionEngine, FileType
 from ml_engine.document_processor import EnterpriseDocumentProcessor
 
+try:
+    import diskcache
+except ImportError:  # caching is skipped without diskcache
+    diskcache = None
+
 upload_bp = Blueprint('upload', __name__)
 
 # Configure upload settings
 UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'uploads')
 MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 16 * 1024 * 1024))  # 16MB default
-ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls', 'json', 'txt', 'pdf', 'docx', 'png', 'jpg', 'jpeg'}
+ALLOWED_EXTENSIONS = frozenset({'.csv', '.xlsx', '.xls', '.json', '.txt', '.pdf', '.docx', '.png', '.jpg', '.jpeg'})
+# Suffixes routed to the document processor rather than data ingestion
+DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc', '.pptx', '.ppt', '.txt', '.rtf', '.html', '.htm'})
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tiff', '.bmp'})
+STREAM_CHUNK_SIZE = 1 << 20  # 1MB write chunks
+PARTIAL_SUFFIX = '.part'
+HASH_SIDECAR_SUFFIX = '.sha256'
+RESULT_SIDECAR_SUFFIX = '.meta.json.gz'
+DOC_PROC_VERSION = '1'  # bump when document processing output changes
+DOCUMENT_CACHE_TTL = 30 * 86400  # 30 days
+DOCUMENT_WORKERS = int(os.environ.get('DOCUMENT_WORKERS', 2))
+DOCUMENT_JOB_HISTORY = 1000
+_FINISHED_JOB_STATES = frozenset({'COMPLETED', 'FAILED'})
+# mkstemp creates files 0600; uploads get the mode a plain open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+UPLOAD_FILE_MODE = 0o666 & ~_UMASK
 
 # Create upload directory if it doesn't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -19,16 +51,317 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 ingestion_engine = FileIngestionEngine()
 document_processor = EnterpriseDocumentProcessor()
 
+# Processed document responses keyed by (content hash, processor version, view)
+document_cache = diskcache.Cache(os.path.join(UPLOAD_FOLDER, '_cache')) if diskcache else None
+
+# Asynchronous document uploads; in production, use Redis/database for job state
+_document_executor = ThreadPoolExecutor(max_workers=DOCUMENT_WORKERS, thread_name_prefix='documents')
+_document_jobs = OrderedDict()
+_document_jobs_lock = threading.Lock()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return PurePath(filename).suffix.lower() in ALLOWED_EXTENSIONS
+
+def _wants_async():
+    return request.args.get('async', '').lower() in ('1', 'true', 'yes')
+
+def _too_large_response():
+    return jsonify({'error': f'File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB'}), 400
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _stream_to_disk(stream, filepath):
+    """Copy an upload stream to disk in fixed-size chunks, hashing as it goes.
+
+    Returns (bytes_written, sha256_hex), or (None, None) past MAX_FILE_SIZE.
+    Data lands in a uniquely named .part file beside the target that is renamed
+    into place only once complete, so a crash mid-upload never leaves a truncated
+    file under the real name and concurrent uploads of one name never interleave.
+    The digest is also stored in a .sha256 sidecar so governance tracking
+    never has to re-read the file.
+    """
+    directory, name = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or None, prefix=name + '.', suffix=PARTIAL_SUFFIX)
+    written = 0
+    hasher = hashlib.sha256()
+    try:
+        with open(fd, 'wb', buffering=STREAM_CHUNK_SIZE) as out:
+            os.fchmod(fd, UPLOAD_FILE_MODE)
+            while True:
+                chunk = stream.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > MAX_FILE_SIZE:
+                    break
+                out.write(chunk)
+                hasher.update(chunk)
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+    
+    if written > MAX_FILE_SIZE:
+        _unlink_quietly(tmp_path)
+        return None, None
+    
+    # A re-upload under the same name invalidates any earlier processing result
+    _unlink_quietly(filepath + RESULT_SIDECAR_SUFFIX)
+    os.replace(tmp_path, filepath)
+    
+    content_hash = hasher.hexdigest()
+    with open(filepath + HASH_SIDECAR_SUFFIX, 'w') as f:
+        f.write(content_hash)
+    return written, content_hash
+
+def _read_content_hash(filepath):
+    try:
+        with open(filepath + HASH_SIDECAR_SUFFIX) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _get_cached_document(content_hash, view):
+    if document_cache is None or not content_hash:
+        return None
+    return document_cache.get((content_hash, DOC_PROC_VERSION, view))
+
+def _cache_document(content_hash, view, data):
+    if document_cache is not None and content_hash:
+        document_cache.set((content_hash, DOC_PROC_VERSION, view), data, expire=DOCUMENT_CACHE_TTL)
+
+def _document_info(result, filename):
+    """Detailed document information as served by /api/document-info"""
+    return {
+        'success': True,
+        'filename': filename,
+        'document_info': {
+            'type': result.metadata.document_type.value,
+            'size_bytes': result.metadata.file_size_bytes,
+            'pages': result.metadata.page_count,
+            'words': result.metadata.word_count,
+            'characters': result.metadata.character_count,
+            'language': result.metadata.language,
+            'title': result.metadata.title,
+            'author': result.metadata.author,
+            'creation_date': result.metadata.creation_date,
+            'has_tables': result.metadata.has_tables,
+            'table_count': result.metadata.table_count,
+            'extraction_quality': result.extraction_quality,
+            'confidence_score': result.metadata.confidence_score
+        },
+        'content_analysis': {
+            'sentiment_score': result.sentiment_score,
+            'key_phrases': result.key_phrases,
+            'summary': result.summary
+        }
+    }
+
+def _write_document_sidecar(filepath, info):
+    """Persist the processed document info next to the upload as gzipped JSON"""
+    with open(filepath + RESULT_SIDECAR_SUFFIX, 'wb') as f:
+        f.write(gzip.compress(orjson.dumps(info, default=str)))
+
+def _read_document_sidecar(filepath):
+    try:
+        with open(filepath + RESULT_SIDECAR_SUFFIX, 'rb') as f:
+            return gzip.decompress(f.read())
+    except (OSError, EOFError):
+        return None
+
+def _remove_upload(filepath):
+    for path in (filepath, filepath + HASH_SIDECAR_SUFFIX, filepath + RESULT_SIDECAR_SUFFIX):
+        _unlink_quietly(path)
+
+def _upload_failed(error, filepath=None):
+    logger.error(f'Upload processing failed: {str(error)}')
+    # Clean up file on error
+    if filepath:
+        try:
+            _remove_upload(filepath)
+        except OSError:
+            pass
+    return jsonify({'error': 'Upload processing failed'}), 500
+
+def _process_document(filepath, filename, content_hash):
+    """Run the document processor; returns (response dict, status code) so it also works off-request"""
+    # Identical content was already processed; skip the parse/OCR pipeline
+    cached = _get_cached_document(content_hash, 'upload')
+    if cached is not None:
+        cached['filename'] = filename
+        logger.info(f'Document cache hit for {filename}')
+        return cached, 200
+    
+    # Use document processor for business documents
+    result = document_processor.process_document(filepath)
+    
+    if not result.is_valid:
+        # Clean up failed file
+        _remove_upload(filepath)
+        return {
+            'error': result.error_message,
+            'document_type': result.metadata.document_type.value
+        }, 400
+    
+    # Persist the detailed info so document-info GETs never re-process
+    info = _document_info(result, filename)
+    _write_document_sidecar(filepath, info)
+    _cache_document(content_hash, 'info', info)
+    
+    # Build response for document processing
+    response_data = {
+        'success': True,
+        'filename': result.metadata.filename,
+        'document_type': result.metadata.document_type.value,
+        'file_size_bytes': result.metadata.file_size_bytes,
+        'content_hash': content_hash,
+        'processing_method': 'document_processing',
+        
+        # Document-specific metadata
+        'document_metadata': {
+            'page_count': result.metadata.page_count,
+            'word_count': result.metadata.word_count,
+            'character_count': result.metadata.character_count,
+            'language': result.metadata.language,
+            'has_tables': result.metadata.has_tables,
+            'table_count': result.metadata.table_count,
+            'has_images': result.metadata.has_images,
+            'extraction_method': result.metadata.extraction_method.value,
+            'confidence_score': round(result.metadata.confidence_score, 3),
+            'processing_time': round(result.metadata.processing_time, 3)
+        },
+        
+        # Content preview
+        'content_preview': {
+            'text_sample': result.text_content[:500] + '...' if result.text_content and len(result.text_content) > 500 else result.text_content,
+            'extraction_quality': result.extraction_quality,
+            'data_completeness': round(result.data_completeness, 2)
+        },
+        
+        # Analytics (if available)
+        'text_analytics': {
+            'sentiment_score': result.sentiment_score,
+            'key_phrases': result.key_phrases[:5] if result.key_phrases else None,
+            'summary': result.summary
+        },
+        
+        # Structured data info
+        'structured_data': {
+            'has_structured_data': result.structured_data is not None,
+            'rows': len(result.structured_data) if result.structured_data is not None else 0,
+            'columns': len(result.structured_data.columns) if result.structured_data is not None else 0,
+            'column_names': list(result.structured_data.columns) if result.structured_data is not None else []
+        },
+        
+        'warnings': result.metadata.warnings or []
+    }
+    
+    # Add data preview if structured data exists
+    if result.structured_data is not None and len(result.structured_data) > 0:
+        response_data['data_preview'] = result.structured_data.head(5).to_dict('records')
+        response_data['data_types'] = {col: str(dtype) for col, dtype in result.structured_data.dtypes.items()}
+    
+    _cache_document(content_hash, 'upload', {k: v for k, v in response_data.items() if k != 'data_preview'})
+    return response_data, 200
+
+def _update_document_job(job_id, **fields):
+    with _document_jobs_lock:
+        _document_jobs[job_id].update(fields, updated_at=time.time())
+
+def _run_document_job(job_id, filepath, filename, content_hash):
+    """Background half of an async upload"""
+    _update_document_job(job_id, status='RUNNING')
+    try:
+        response_data, status_code = _process_document(filepath, filename, content_hash)
+    except Exception:
+        logger.exception(f'Document job {job_id} failed')
+        try:
+            _remove_upload(filepath)
+        except OSError:
+            pass
+        _update_document_job(job_id, status='FAILED', error='Document processing failed')
+        return
+    
+    if status_code >= 400:
+        _update_document_job(job_id, status='FAILED', error=response_data.get('error'), result=response_data)
+    else:
+        _update_document_job(job_id, status='COMPLETED', result=response_data)
+
+def _submit_document_job(filepath, filename, content_hash):
+    job_id = secrets.token_hex(8)
+    with _document_jobs_lock:
+        _document_jobs[job_id] = {'job_id': job_id, 'filename': filename, 'status': 'PENDING', 'updated_at': time.time()}
+        # Keep a bounded history of finished jobs; pending/running ones are never evicted
+        excess = len(_document_jobs) - DOCUMENT_JOB_HISTORY
+        if excess > 0:
+            finished = (jid for jid, job in _document_jobs.items() if job['status'] in _FINISHED_JOB_STATES)
+            for jid in list(islice(finished, excess)):
+                del _document_jobs[jid]
+    _document_executor.submit(_run_document_job, job_id, filepath, filename, content_hash)
+    return job_id
+
+def _process_upload(filepath, filename, file_size, content_hash, process_async=False):
+    """Run the saved upload through the document or data ingestion pipeline"""
+    logger.info(f'File uploaded: {filename}, size: {file_size} bytes')
+    
+    # Determine processing approach based on file type
+    file_ext = PurePath(filename).suffix.lower()
+    
+    # Document formats (PDF, DOCX, PPTX, etc.) and images
+    if file_ext in DOCUMENT_EXTENSIONS or file_ext in IMAGE_EXTENSIONS:
+        # Large PDFs/OCR can take seconds; ?async=true hands them to the background pool
+        if process_async:
+            job_id = _submit_document_job(filepath, filename, content_hash)
+            return jsonify({'job_id': job_id, 'status': 'processing'}), 202
+        
+        response_data, status_code = _process_document(filepath, filename, content_hash)
+        return jsonify(response_data), status_code
+    
+    else:
+        # Use traditional data ingestion for CSV, JSON, etc.
+        dataframe, file_metadata = ingestion_engine.ingest_file(filepath)
+        
+        if not file_metadata.is_valid:
+            # Clean up failed file
+            _remove_upload(filepath)
+            return jsonify({
+                'error': file_metadata.error_message,
+                'file_type': file_metadata.file_type.value if file_metadata.file_type else 'unknown'
+            }), 400
+        
+        # Traditional data response
+        response_data = {
+            'success': True,
+            'filename': file_metadata.filename,
+            'file_type': file_metadata.file_type.value,
+            'size_bytes': file_metadata.size_bytes,
+            'content_hash': content_hash,
+            'encoding': file_metadata.encoding,
+            'processing_method': 'data_ingestion',
+            'rows': file_metadata.row_count,
+            'columns': file_metadata.column_count,
+            'column_names': file_metadata.columns,
+            'processing_notes': file_metadata.processing_notes or []
+        }
+        
+        # Add data preview if available
+        if dataframe is not None and len(dataframe) > 0:
+            response_data['preview'] = dataframe.head(5).to_dict('records')
+            response_data['data_types'] = {col: str(dtype) for col, dtype in dataframe.dtypes.items()}
+        
+        return jsonify(response_data)
 
 @upload_bp.route('/api/upload', methods=['POST'])
 def upload_file():
     """Enterprise file upload supporting all business document formats"""
+    filepath = None
     try:
         if 'file' not in request.files:
             return jsonify({'error': 'No file provided'}), 400
@@ -40,146 +373,53 @@ def upload_file():
         if not allowed_file(file.filename):
             return jsonify({'error': 'File type not allowed'}), 400
         
-        # Check file size
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to beginning
-        
-        if file_size > MAX_FILE_SIZE:
-            return jsonify({'error': f'File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB'}), 400
-        
         # Save file securely
         filename = secure_filename(file.filename)
         if not filename:
             return jsonify({'error': 'Invalid filename'}), 400
             
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(filepath)
+        destination = os.path.join(UPLOAD_FOLDER, filename)
         
-        logger.info(f'File uploaded: {filename}, size: {file_size} bytes')
+        # Size is enforced on bytes written rather than a seek/tell probe
+        file_size, content_hash = _stream_to_disk(file.stream, destination)
+        if file_size is None:
+            return _too_large_response()
+        # Only a completed upload is ours to clean up; a failed stream leaves any earlier file intact
+        filepath = destination
         
-        # Determine processing approach based on file type
-        file_ext = os.path.splitext(filename)[1].lower()
+        return _process_upload(filepath, filename, file_size, content_hash, _wants_async())
+    
+    except Exception as e:
+        return _upload_failed(e, filepath)
+
+@upload_bp.route('/api/upload/stream/<filename>', methods=['PUT'])
+def upload_file_stream(filename):
+    """Raw-body upload: the request stream goes straight to disk, skipping multipart parsing"""
+    filepath = None
+    try:
+        filename = secure_filename(filename)
+        if not filename:
+            return jsonify({'error': 'Invalid filename'}), 400
         
-        # Document formats (PDF, DOCX, PPTX, etc.)
-        document_formats = ['.pdf', '.docx', '.doc', '.pptx', '.ppt', '.txt', '.rtf', '.html', '.htm']
-        image_formats = ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']
+        if not allowed_file(filename):
+            return jsonify({'error': 'File type not allowed'}), 400
         
-        if file_ext in document_formats or file_ext in image_formats:
-            # Use document processor for business documents
-            result = document_processor.process_document(filepath)
-            
-            if not result.is_valid:
-                # Clean up failed file
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                return jsonify({
-                    'error': result.error_message,
-                    'document_type': result.metadata.document_type.value
-                }), 400
-            
-            # Build response for document processing
-            response_data = {
-                'success': True,
-                'filename': result.metadata.filename,
-                'document_type': result.metadata.document_type.value,
-                'file_size_bytes': result.metadata.file_size_bytes,
-                'processing_method': 'document_processing',
-                
-                # Document-specific metadata
-                'document_metadata': {
-                    'page_count': result.metadata.page_count,
-                    'word_count': result.metadata.word_count,
-                    'character_count': result.metadata.character_count,
-                    'language': result.metadata.language,
-                    'has_tables': result.metadata.has_tables,
-                    'table_count': result.metadata.table_count,
-                    'has_images': result.metadata.has_images,
-                    'extraction_method': result.metadata.extraction_method.value,
-                    'confidence_score': round(result.metadata.confidence_score, 3),
-                    'processing_time': round(result.metadata.processing_time, 3)
-                },
-                
-                # Content preview
-                'content_preview': {
-                    'text_sample': result.text_content[:500] + '...' if result.text_content and len(result.text_content) > 500 else result.text_content,
-                    'extraction_quality': result.extraction_quality,
-                    'data_completeness': round(result.data_completeness, 2)
-                },
-                
-                # Analytics (if available)
-                'text_analytics': {
-                    'sentiment_score': result.sentiment_score,
-                    'key_phrases': result.key_phrases[:5] if result.key_phrases else None,
-                    'summary': result.summary
-                },
-                
-                # Structured data info
-                'structured_data': {
-                    'has_structured_data': result.structured_data is not None,
-                    'rows': len(result.structured_data) if result.structured_data is not None else 0,
-                    'columns': len(result.structured_data.columns) if result.structured_data is not None else 0,
-                    'column_names': list(result.structured_data.columns) if result.structured_data is not None else []
-                },
-                
-                'warnings': result.metadata.warnings or []
-            }
-            
-            # Add data preview if structured data exists
-            if result.structured_data is not None and len(result.structured_data) > 0:
-                response_data['data_preview'] = result.structured_data.head(5).to_dict('records')
-                response_data['data_types'] = result.structured_data.dtypes.astype(str).to_dict()
-            
-            return jsonify(response_data)
+        if request.content_length and request.content_length > MAX_FILE_SIZE:
+            return _too_large_response()
         
-        else:
-            # Use traditional data ingestion for CSV, JSON, etc.
-            dataframe, file_metadata = ingestion_engine.ingest_file(filepath)
-            
-            if not file_metadata.is_valid:
-                # Clean up failed file
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                return jsonify({
-                    'error': file_metadata.error_message,
-                    'file_type': file_metadata.file_type.value if file_metadata.file_type else 'unknown'
-                }), 400
-            
-            # Traditional data response
-            response_data = {
-                'success': True,
-                'filename': file_metadata.filename,
-                'file_type': file_metadata.file_type.value,
-                'size_bytes': file_metadata.size_bytes,
-                'encoding': file_metadata.encoding,
-                'processing_method': 'data_ingestion',
-                'rows': file_metadata.row_count,
-                'columns': file_metadata.column_count,
-                'column_names': file_metadata.columns,
-                'processing_notes': file_metadata.processing_notes or []
-            }
-            
-            # Add data preview if available
-            if dataframe is not None and len(dataframe) > 0:
-                response_data['preview'] = dataframe.head(5).to_dict('records')
-                response_data['data_types'] = dataframe.dtypes.astype(str).to_dict()
-            
-            return jsonify(response_data)
+        destination = os.path.join(UPLOAD_FOLDER, filename)
+        file_size, content_hash = _stream_to_disk(request.stream, destination)
+        if file_size is None:
+            return _too_large_response()
+        filepath = destination
+        
+        return _process_upload(filepath, filename, file_size, content_hash, _wants_async())
     
     except Exception as e:
-        logger.error(f'Upload processing failed: {str(e)}')
-        # Clean up file on error
-        if 'filepath' in locals() and os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-            except OSError:
-                pass
-        return jsonify({'error': 'Upload processing failed'}), 500
+        return _upload_failed(e, filepath)
 
-@upload_bp.route('/api/supported-formats', methods=['GET'])
-def get_supported_formats():
-    """Return comprehensive list of supported formats"""
-    
+def _build_supported_formats():
+    """Comprehensive list of supported formats; constant for the life of the process"""
     # Data formats
     data_formats = {
         'structured': ['csv', 'xlsx', 'xls', 'tsv'],
@@ -208,7 +448,25 @@ def get_supported_formats():
         }
     }
     
-    return jsonify(supported_formats)
+    return supported_formats
+
+_SUPPORTED_FORMATS_JSON = orjson.dumps(_build_supported_formats())
+
+@upload_bp.route('/api/upload/status/<job_id>', methods=['GET'])
+def get_upload_status(job_id):
+    """Poll an asynchronous document upload; includes the result once COMPLETED"""
+    with _document_jobs_lock:
+        job = _document_jobs.get(job_id)
+        job = dict(job) if job else None
+    
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@upload_bp.route('/api/supported-formats', methods=['GET'])
+def get_supported_formats():
+    """Return comprehensive list of supported formats"""
+    return Response(_SUPPORTED_FORMATS_JSON, mimetype='application/json')
 
 @upload_bp.route('/api/document-info/<filename>', methods=['GET'])
 def get_document_info(filename):
@@ -219,37 +477,27 @@ def get_document_info(filename):
         if not os.path.exists(filepath):
             return jsonify({'error': 'File not found'}), 404
         
-        # Process document to get detailed info
-        result = document_processor.process_document(filepath)
+        # Served from the sidecar written at upload time when possible
+        sidecar = _read_document_sidecar(filepath)
+        if sidecar is not None:
+            return Response(sidecar, mimetype='application/json')
         
-        if not result.is_valid:
-            return jsonify({'error': result.error_message}), 400
+        content_hash = _read_content_hash(filepath)
+        info = _get_cached_document(content_hash, 'info')
+        if info is not None:
+            info['filename'] = filename
+        else:
+            # Process document to get detailed info
+            result = document_processor.process_document(filepath)
+            
+            if not result.is_valid:
+                return jsonify({'error': result.error_message}), 400
+            
+            info = _document_info(result, filename)
+            _cache_document(content_hash, 'info', info)
         
-        # Return comprehensive document information
-        return jsonify({
-            'success': True,
-            'filename': filename,
-            'document_info': {
-                'type': result.metadata.document_type.value,
-                'size_bytes': result.metadata.file_size_bytes,
-                'pages': result.metadata.page_count,
-                'words': result.metadata.word_count,
-                'characters': result.metadata.character_count,
-                'language': result.metadata.language,
-                'title': result.metadata.title,
-                'author': result.metadata.author,
-                'creation_date': result.metadata.creation_date,
-                'has_tables': result.metadata.has_tables,
-                'table_count': result.metadata.table_count,
-                'extraction_quality': result.extraction_quality,
-                'confidence_score': result.metadata.confidence_score
-            },
-            'content_analysis': {
-                'sentiment_score': result.sentiment_score,
-                'key_phrases': result.key_phrases,
-                'summary': result.summary
-            }
-        })
+        _write_document_sidecar(filepath, info)
+        return jsonify(info)
     
     except Exception as e:
         return jsonify({'error': f'Document info retrieval failed: {str(e)}'}), 500
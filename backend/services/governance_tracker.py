@@ -1,16 +1,63 @@
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func, distinct
+from sqlalchemy.orm import sessionmaker, joinedload
 from models.governance_schema import Dataset, TrainingRun, Model, Decision, Prediction
+from services.row_buffer import get_row_buffer
 import hashlib
-import json
+import os
+from contextlib import contextmanager
+import msgpack
+import xxhash
 from datetime import datetime
 
+HASH_CHUNK_SIZE = 1 << 20
+
+def _file_sha256(path):
+    """SHA-256 of a file, hashed in fixed-size buffers"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+, C loop that releases the GIL
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        hasher = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+def _canonical(value):
+    """Sort dict keys recursively so equal inputs pack to identical bytes"""
+    if isinstance(value, dict):
+        return {k: _canonical(value[k]) for k in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
 class GovernanceTracker:
     def __init__(self, db_session):
         self.db_session = db_session
+        self.prediction_buffer = get_row_buffer(db_session, Prediction)
     
-    def register_dataset(self, filename, file_content, metadata, user_id):
-        """Register dataset with governance tracking"""
-        content_hash = hashlib.sha256(file_content).hexdigest()
+    @contextmanager
+    def transaction(self):
+        """Group several tracker calls into a single commit"""
+        self.db_session.info['in_batch'] = True
+        try:
+            yield self
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+        finally:
+            self.db_session.info.pop('in_batch', None)
+    
+    def _commit(self):
+        # Inside transaction() only flush, so generated ids are available without committing
+        if self.db_session.info.get('in_batch'):
+            self.db_session.flush()
+        else:
+            self.db_session.commit()
+    
+    def register_dataset(self, filename, file_path, metadata, user_id, content_hash=None):
+        """Register dataset with governance tracking; pass content_hash when it was computed at upload"""
+        if content_hash is None:
+            content_hash = _file_sha256(file_path)
         
         # Check if dataset already exists
         existing = self.db_session.query(Dataset).filter_by(content_hash=content_hash).first()
@@ -22,14 +69,14 @@ class GovernanceTracker:
             content_hash=content_hash,
             rows=metadata.get('rows'),
             columns=metadata.get('columns'),
-            size_bytes=len(file_content),
+            size_bytes=os.path.getsize(file_path),
             quality_score=metadata.get('quality_score'),
             uploaded_by=user_id,
             data_classification=metadata.get('classification', 'internal')
         )
         
         self.db_session.add(dataset)
-        self.db_session.commit()
+        self._commit()
         return dataset.id
     
     def start_training_run(self, dataset_id, config, user_id, experiment_name=None):
@@ -48,7 +95,7 @@ class GovernanceTracker:
         )
         
         self.db_session.add(training_run)
-        self.db_session.commit()
+        self._commit()
         return training_run.id
     
     def log_decision(self, training_run_id, decision_type, chosen_option, reasoning, 
@@ -67,10 +114,10 @@ class GovernanceTracker:
         )
         
         self.db_session.add(decision)
-        self.db_session.commit()
+        self._commit()
         return decision.id
     
-    def register_model(self, training_run_id, model_path, metrics, version=None):
+    def register_model(self, training_run_id, model_path, metrics, version=None, precomputed_hash=None):
         """Register trained model with versioning"""
         # Generate version if not provided
         if not version:
@@ -79,9 +126,8 @@ class GovernanceTracker:
             ).count()
             version = f"v1.{existing_count}"
         
-        # Calculate file hash
-        with open(model_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        # Calculate file hash unless the caller already has it
+        file_hash = precomputed_hash or _file_sha256(model_path)
         
         model = Model(
             training_run_id=training_run_id,
@@ -96,33 +142,35 @@ class GovernanceTracker:
         )
         
         self.db_session.add(model)
-        self.db_session.commit()
+        self._commit()
         return model.id
     
     def log_prediction(self, model_id, input_features, prediction, confidence, 
                       user_id=None, request_id=None):
-        """Log prediction for audit and feedback"""
-        input_hash = hashlib.sha256(
-            json.dumps(input_features, sort_keys=True).encode()
+        """Log prediction for audit and feedback; rows are buffered and bulk-inserted"""
+        # Dedupe/audit key only, so a fast non-cryptographic hash is enough
+        input_hash = xxhash.xxh3_128(
+            msgpack.packb(_canonical(input_features), default=str, use_bin_type=True)
         ).hexdigest()
         
-        prediction_record = Prediction(
-            model_id=model_id,
-            input_hash=input_hash,
-            input_features=input_features,
-            prediction=str(prediction),
-            confidence=confidence,
-            user_id=user_id,
-            request_id=request_id
-        )
-        
-        self.db_session.add(prediction_record)
-        self.db_session.commit()
-        return prediction_record.id
+        self.prediction_buffer.append({
+            'model_id': model_id,
+            'input_hash': input_hash,
+            'input_features': input_features,
+            'prediction': str(prediction),
+            'confidence': confidence,
+            'predicted_at': datetime.utcnow(),
+            'user_id': user_id,
+            'request_id': request_id
+        })
     
     def get_model_lineage(self, model_id):
         """Get complete lineage for a model"""
-        model = self.db_session.query(Model).filter_by(id=model_id).first()
+        # Eager-load the whole graph: model + run + dataset joined, decisions in one IN query
+        model = self.db_session.query(Model).options(
+            joinedload(Model.training_run).joinedload(TrainingRun.dataset),
+            joinedload(Model.training_run).selectinload(TrainingRun.decisions)
+        ).filter_by(id=model_id).first()
         if not model:
             return None
         
@@ -164,16 +212,33 @@ class GovernanceTracker:
     
     def get_dataset_usage(self, dataset_id):
         """Track how dataset has been used"""
-        dataset = self.db_session.query(Dataset).filter_by(id=dataset_id).first()
-        training_runs = dataset.training_runs
+        filename = self.db_session.query(Dataset.filename).filter_by(id=dataset_id).scalar()
+        if filename is None:
+            return None
+        
+        # Run count and best model accuracy in one aggregate query
+        total_runs, best_accuracy = self.db_session.query(
+            func.count(distinct(TrainingRun.id)),
+            func.max(Model.accuracy)
+        ).outerjoin(Model, Model.training_run_id == TrainingRun.id).filter(
+            TrainingRun.dataset_id == dataset_id
+        ).one()
+        
+        algorithms = self.db_session.query(TrainingRun.algorithm).filter(
+            TrainingRun.dataset_id == dataset_id,
+            TrainingRun.algorithm.isnot(None)
+        ).distinct()
+        
+        timeline = self.db_session.query(TrainingRun.started_at, TrainingRun.algorithm).filter(
+            TrainingRun.dataset_id == dataset_id,
+            TrainingRun.started_at.isnot(None)
+        ).order_by(TrainingRun.started_at).yield_per(1000)
         
         return {
             'dataset_id': dataset_id,
-            'filename': dataset.filename,
-            'total_training_runs': len(training_runs),
-            'algorithms_used': list(set(tr.algorithm for tr in training_runs if tr.algorithm)),
-            'best_accuracy': max((tr.models[0].accuracy for tr in training_runs 
-                                if tr.models and tr.models[0].accuracy), default=0),
-            'usage_timeline': [(tr.started_at.isoformat(), tr.algorithm) 
-                             for tr in training_runs if tr.started_at]
-        }
\ No newline at end of file
+            'filename': filename,
+            'total_training_runs': total_runs,
+            'algorithms_used': [algorithm for (algorithm,) in algorithms],
+            'best_accuracy': best_accuracy or 0,
+            'usage_timeline': [(started_at.isoformat(), algorithm) for started_at, algorithm in timeline]
+        }
@@ -1,21 +1,85 @@
+import os
 import threading
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import partial
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models.job_models import MLJob, JobQueue, JobStatus
 
+JOB_WAIT_TIMEOUT = 30  # seconds; fallback poll for jobs queued by other processes
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', os.cpu_count() or 1))
+
+def _release_session(db_session):
+    """Drop this thread's session when the manager was given a scoped_session registry"""
+    if hasattr(db_session, 'remove'):
+        db_session.remove()
+
+# Per-process session factory for pool workers, created on first use
+_worker_sessions = None
+
+def _worker_session(db_url):
+    global _worker_sessions
+    if _worker_sessions is None:
+        _worker_sessions = sessionmaker(bind=create_engine(db_url))
+    return _worker_sessions()
+
+def _update_job_progress(session, job_id, progress, stage):
+    """Update job progress and stage"""
+    job = session.query(MLJob).filter_by(id=job_id).first()
+    if job:
+        job.progress = progress
+        job.stage = stage
+        job.updated_at = datetime.utcnow()
+        session.commit()
+
+def _run_training(job_id, config, db_url):
+    """Training body; runs in a pool worker process with its own DB session"""
+    session = _worker_session(db_url)
+    try:
+        # Update progress stages
+        _update_job_progress(session, job_id, 10, "Loading data")
+        
+        # Simulate ML training steps
+        _update_job_progress(session, job_id, 30, "Preprocessing")
+        time.sleep(2)  # Simulate preprocessing
+        
+        _update_job_progress(session, job_id, 60, "Training model")
+        time.sleep(5)  # Simulate training
+        
+        _update_job_progress(session, job_id, 90, "Saving model")
+        model_path = f"models/model_{job_id}.joblib"
+        
+        return model_path, {
+            'accuracy': 0.87,
+            'model_type': 'RandomForest',
+            'features': 10
+        }
+    finally:
+        session.close()
+
 class AsyncJobManager:
     def __init__(self, db_session):
+        # Pass a scoped_session registry (database.connection.create_session_registry)
+        # so the dispatcher and request threads each get their own Session
         self.db_session = db_session
         self.worker_thread = None
+        self.pool = None
         self.running = False
-        self.lock = threading.Lock()
+        # Fresh sessions for pool callbacks, which run off the dispatcher thread
+        self._sessions = sessionmaker(bind=db_session.get_bind())
+        self._slots = threading.BoundedSemaphore(JOB_WORKERS)
+        self._job_available = threading.Condition()
+        self._job_signalled = False
     
     def start_worker(self):
-        """Start background worker thread"""
+        """Start the process pool and the dispatcher thread that feeds it"""
         if not self.running:
             self.running = True
+            self.pool = ProcessPoolExecutor(max_workers=JOB_WORKERS)
             self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
             self.worker_thread.start()
     
@@ -39,6 +103,7 @@ class AsyncJobManager:
         self.db_session.add(queue_entry)
         
         self.db_session.commit()
+        self._notify_worker()
         return job
     
     def get_job(self, job_id):
@@ -67,91 +132,119 @@ class AsyncJobManager:
         return True
     
     def _worker_loop(self):
-        """Background worker that processes jobs"""
+        """Dispatcher: claim jobs only while a pool worker is free"""
         while self.running:
+            self._slots.acquire()
             try:
                 job_id = self._get_next_job()
                 if job_id:
                     self._process_job(job_id)
                 else:
-                    time.sleep(5)  # No jobs, wait
+                    self._slots.release()
+                    self._wait_for_job()
             except Exception as e:
+                self._slots.release()
                 print(f"Worker error: {e}")
                 time.sleep(10)
+            finally:
+                _release_session(self.db_session)
+    
+    def _notify_worker(self):
+        """Wake the worker as soon as a job is queued"""
+        with self._job_available:
+            self._job_signalled = True
+            self._job_available.notify()
+    
+    def _wait_for_job(self):
+        """Block until create_job signals or the fallback timeout elapses"""
+        with self._job_available:
+            self._job_available.wait_for(lambda: self._job_signalled, timeout=JOB_WAIT_TIMEOUT)
+            self._job_signalled = False
     
     def _get_next_job(self):
-        """Get next job from queue"""
-        with self.lock:
-            # Get highest priority pending job
-            queue_entry = self.db_session.query(JobQueue).join(MLJob).filter(
-                MLJob.status == JobStatus.PENDING
-            ).order_by(JobQueue.priority_score.desc(), JobQueue.queued_at).first()
-            
-            if queue_entry:
-                # Mark job as running
-                job = self.db_session.query(MLJob).filter_by(id=queue_entry.job_id).first()
-                job.status = JobStatus.RUNNING
-                job.started_at = datetime.utcnow()
-                
-                # Remove from queue
-                self.db_session.delete(queue_entry)
-                self.db_session.commit()
-                
-                return queue_entry.job_id
+        """Atomically claim the highest priority pending job"""
+        # FOR UPDATE SKIP LOCKED lets concurrent workers claim different rows without an app-level lock
+        queue_entry = self.db_session.query(JobQueue).join(MLJob).filter(
+            MLJob.status == JobStatus.PENDING
+        ).order_by(
+            JobQueue.priority_score.desc(), JobQueue.queued_at
+        ).with_for_update(skip_locked=True, of=JobQueue).first()
+        
+        if not queue_entry:
+            self.db_session.rollback()  # release the claim transaction
+            return None
+        
+        job_id = queue_entry.job_id
+        
+        # Mark job as running and remove it from the queue in the same transaction
+        self.db_session.query(MLJob).filter_by(id=job_id).update({
+            'status': JobStatus.RUNNING,
+            'started_at': datetime.utcnow()
+        })
+        self.db_session.delete(queue_entry)
+        self.db_session.commit()
         
-        return None
+        return job_id
     
     def _process_job(self, job_id):
-        """Process single ML training job"""
+        """Submit a claimed job to the process pool"""
         job = self.get_job(job_id)
         if not job:
+            self._slots.release()
             return
         
         try:
-            # Update progress stages
-            self._update_job_progress(job_id, 10, "Loading data")
-            
-            # Simulate ML training steps
             config = json.loads(job.config) if job.config else {}
-            
-            self._update_job_progress(job_id, 30, "Preprocessing")
-            time.sleep(2)  # Simulate preprocessing
-            
-            self._update_job_progress(job_id, 60, "Training model")
-            time.sleep(5)  # Simulate training
-            
-            self._update_job_progress(job_id, 90, "Saving model")
-            model_path = f"models/model_{job_id}.joblib"
-            
-            # Complete job
-            job.status = JobStatus.COMPLETED
-            job.progress = 100
-            job.stage = "Completed"
-            job.completed_at = datetime.utcnow()
-            job.model_path = model_path
-            job.result = json.dumps({
-                'accuracy': 0.87,
-                'model_type': 'RandomForest',
-                'features': 10
-            })
-            
-            self.db_session.commit()
-            
+            db_url = self.db_session.get_bind().url.render_as_string(hide_password=False)
+            future = self._submit(job_id, config, db_url)
         except Exception as e:
-            # Mark job as failed
+            # The job is already RUNNING and off the queue; never leave it stranded there
             job.status = JobStatus.FAILED
             job.error_message = str(e)
             job.completed_at = datetime.utcnow()
             self.db_session.commit()
+            self._slots.release()
+            return
+        
+        future.add_done_callback(partial(self._finalize_job, job_id))
     
-    def _update_job_progress(self, job_id, progress, stage):
-        """Update job progress and stage"""
-        job = self.get_job(job_id)
-        if job:
-            job.progress = progress
-            job.stage = stage
-            job.updated_at = datetime.utcnow()
-            self.db_session.commit()
+    def _submit(self, job_id, config, db_url):
+        """Submit to the pool, replacing it once if a crashed worker has broken it"""
+        try:
+            return self.pool.submit(_run_training, job_id, config, db_url)
+        except BrokenProcessPool:
+            self.pool.shutdown(wait=False)
+            self.pool = ProcessPoolExecutor(max_workers=JOB_WORKERS)
+            return self.pool.submit(_run_training, job_id, config, db_url)
+    
+    def _finalize_job(self, job_id, future):
+        """Record the pool result in a fresh session and free the worker slot"""
+        session = self._sessions()
+        try:
+            job = session.query(MLJob).filter_by(id=job_id).first()
+            if not job:
+                return
+            
+            error = future.exception()
+            if error is None:
+                model_path, result = future.result()
+                
+                # Complete job
+                job.status = JobStatus.COMPLETED
+                job.progress = 100
+                job.stage = "Completed"
+                job.model_path = model_path
+                job.result = json.dumps(result)
+            else:
+                # Mark job as failed
+                job.status = JobStatus.FAILED
+                job.error_message = str(error)
+            
+            job.completed_at = datetime.utcnow()
+            session.commit()
+        finally:
+            session.close()
+            self._slots.release()
     
     def _get_priority_score(self, priority):
         """Convert priority to numeric score"""
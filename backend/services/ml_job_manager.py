@@ -1,9 +1,12 @@
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import threading
+import time
 import uuid
 import json
 
+JOB_WAIT_TIMEOUT = 30  # seconds; fallback poll for jobs submitted by other processes
+
 class MLJobManager:
     """Unified job management for ML training and monitoring"""
     
@@ -11,6 +14,8 @@ class MLJobManager:
         self.db_session = db_session
         self.worker_thread = None
         self.running = False
+        self._job_available = threading.Condition()
+        self._job_signalled = False
     
     def submit_training_job(self, filename, config=None, user_id=None):
         """Submit ML training job with governance tracking"""
@@ -29,6 +34,11 @@ class MLJobManager:
         self.db_session.add(job)
         self.db_session.commit()
         
+        # Wake the worker immediately instead of waiting for the next poll
+        with self._job_available:
+            self._job_signalled = True
+            self._job_available.notify()
+        
         return job_id
     
     def get_job_status(self, job_id):
@@ -60,8 +70,13 @@ class MLJobManager:
             
             if job:
                 self._execute_job(job)
+                # Give each job a fresh thread-local session when using a scoped_session registry
+                if hasattr(self.db_session, 'remove'):
+                    self.db_session.remove()
             else:
-                time.sleep(5)
+                with self._job_available:
+                    self._job_available.wait_for(lambda: self._job_signalled, timeout=JOB_WAIT_TIMEOUT)
+                    self._job_signalled = False
     
     def _execute_job(self, job):
         """Execute single ML job"""
@@ -1,87 +1,123 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime
+import logging
+import threading
+from datetime import datetime, timedelta
 from typing import Dict, List
+from sqlalchemy import func
+from models.governance_schema import Prediction, DriftAlert
+from services.row_buffer import get_row_buffer
+
+# Running confidence means per model: a fast "recent" and a slow "baseline"
+EWMA_RECENT_ALPHA = 0.02
+EWMA_BASELINE_ALPHA = 0.001
+DRIFT_MIN_SAMPLES = 50
+DRIFT_DROP_RATIO = 0.8  # alert on a 20% drop below baseline
+DRIFT_SEED_WINDOW = 100
+
+logger = logging.getLogger(__name__)
 
 class ModelMonitor:
     """Basic model performance and data monitoring"""
     
     def __init__(self, db_session):
         self.db_session = db_session
+        self.prediction_buffer = get_row_buffer(db_session, Prediction)
+        self.alert_buffer = get_row_buffer(db_session, DriftAlert)
+        self._ewma = {}
+        self._ewma_lock = threading.Lock()
     
     def track_prediction(self, model_id, input_features, prediction, confidence):
         """Track prediction for monitoring"""
-        prediction_record = Prediction(
-            model_id=model_id,
-            input_features=input_features,
-            prediction=str(prediction),
-            confidence=confidence,
-            predicted_at=datetime.utcnow()
-        )
-        
-        self.db_session.add(prediction_record)
-        self.db_session.commit()
+        self.prediction_buffer.append({
+            'model_id': model_id,
+            'input_features': input_features,
+            'prediction': str(prediction),
+            'confidence': confidence,
+            'predicted_at': datetime.utcnow()
+        })
         
         # Simple drift check: compare recent vs baseline
-        self._check_simple_drift(model_id)
+        if confidence is not None:
+            self._check_simple_drift(model_id, confidence)
     
-    def _check_simple_drift(self, model_id):
-        """Basic drift detection using prediction patterns"""
-        # Get recent predictions (last 100)
-        recent_predictions = self.db_session.query(Prediction).filter_by(
-            model_id=model_id
-        ).order_by(Prediction.predicted_at.desc()).limit(100).all()
-        
-        if len(recent_predictions) < 50:
-            return  # Not enough data
+    def _seed_drift_state(self, model_id):
+        """Seed the running means from stored history the first time a model is seen"""
+        rows = self.db_session.query(Prediction.confidence).filter(
+            Prediction.model_id == model_id,
+            Prediction.confidence.isnot(None)
+        ).order_by(Prediction.predicted_at.desc()).limit(DRIFT_SEED_WINDOW).all()
         
-        # Simple checks
-        recent_confidences = [p.confidence for p in recent_predictions[:50]]
-        older_confidences = [p.confidence for p in recent_predictions[50:]]
+        mean = float(np.mean([row[0] for row in rows])) if rows else None
+        return {'recent': mean, 'baseline': mean, 'n': len(rows), 'alerted': False}
+    
+    def _check_simple_drift(self, model_id, confidence):
+        """O(1) drift detection from exponentially weighted confidence means"""
+        state = self._ewma.get(model_id)
+        if state is None:
+            seeded = self._seed_drift_state(model_id)
+            with self._ewma_lock:
+                state = self._ewma.setdefault(model_id, seeded)
         
-        if older_confidences:
-            recent_avg = np.mean(recent_confidences)
-            older_avg = np.mean(older_confidences)
+        with self._ewma_lock:
+            if state['recent'] is None:
+                state['recent'] = state['baseline'] = confidence
+            else:
+                state['recent'] += EWMA_RECENT_ALPHA * (confidence - state['recent'])
+                state['baseline'] += EWMA_BASELINE_ALPHA * (confidence - state['baseline'])
+            state['n'] += 1
             
-            # Alert if confidence drops significantly
-            if recent_avg < older_avg * 0.8:  # 20% drop
-                self._create_drift_alert(model_id, 'confidence_drop', recent_avg)
+            drifted = state['n'] > DRIFT_MIN_SAMPLES and state['recent'] < state['baseline'] * DRIFT_DROP_RATIO
+            # Alert once per episode; re-arm after confidence recovers
+            should_alert = drifted and not state['alerted']
+            state['alerted'] = drifted
+            recent_avg = state['recent']
+        
+        if should_alert:
+            self._create_drift_alert(model_id, 'confidence_drop', recent_avg)
     
     def _create_drift_alert(self, model_id, alert_type, metric_value):
-        """Create simple drift alert"""
-        print(f"DRIFT ALERT: Model {model_id} - {alert_type}: {metric_value}")
-        
-        # Store alert in database
-        alert = DriftAlert(
-            model_id=model_id,
-            alert_type=alert_type,
-            metric_value=metric_value,
-            created_at=datetime.utcnow()
+        """Create simple drift alert; logged and queued, never written on the prediction path"""
+        logger.warning(
+            'Drift alert for model %s: %s=%.4f', model_id, alert_type, metric_value,
+            extra={'model_id': model_id, 'alert_type': alert_type, 'metric_value': metric_value}
         )
         
-        self.db_session.add(alert)
-        self.db_session.commit()
+        # Stored in batches by the buffer's flusher thread
+        self.alert_buffer.append({
+            'model_id': model_id,
+            'alert_type': alert_type,
+            'metric_value': metric_value,
+            'created_at': datetime.utcnow()
+        })
     
     def get_model_health(self, model_id, days=7):
         """Get basic model health metrics"""
         # Get predictions from last N days
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        predictions = self.db_session.query(Prediction).filter(
+        # Aggregate in the database instead of pulling every row into Python
+        prediction_count, avg_confidence, min_confidence, max_confidence = self.db_session.query(
+            func.count(Prediction.id),
+            func.avg(Prediction.confidence),
+            func.min(Prediction.confidence),
+            func.max(Prediction.confidence)
+        ).filter(
             Prediction.model_id == model_id,
             Prediction.predicted_at >= cutoff_date
-        ).all()
+        ).one()
         
-        if not predictions:
+        if not prediction_count:
             return {'status': 'no_data'}
         
-        confidences = [p.confidence for p in predictions]
+        avg_confidence = float(avg_confidence) if avg_confidence is not None else None
         
         return {
             'model_id': model_id,
-            'prediction_count': len(predictions),
-            'avg_confidence': np.mean(confidences),
-            'min_confidence': min(confidences),
-            'max_confidence': max(confidences),
-            'health_status': 'healthy' if np.mean(confidences) > 0.7 else 'warning'
-        }
\ No newline at end of file
+            'prediction_count': prediction_count,
+            'avg_confidence': avg_confidence,
+            'min_confidence': min_confidence,
+            'max_confidence': max_confidence,
+            'health_status': 'healthy' if avg_confidence is not None and avg_confidence > 0.7 else 'warning',
+            'prediction_buffer': self.prediction_buffer.stats()
+        }
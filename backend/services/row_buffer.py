@@ -0,0 +1,98 @@
+"""Write-behind buffering of ORM rows (predictions, drift alerts) flushed in bulk from a background thread"""
+
+import atexit
+import logging
+import threading
+from collections import deque
+
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 1000
+FLUSH_INTERVAL = 5.0  # seconds
+MAX_BUFFERED_ROWS = 100000  # beyond this, new rows are dropped (and counted) until the DB recovers
+MAX_FLUSH_RETRIES = 5  # consecutive failed flushes before a batch is given up on
+
+class RowBuffer:
+    """Buffer rows for one mapper in memory and bulk-insert them from a background thread"""
+
+    def __init__(self, db_session, mapper, batch_size=FLUSH_BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        # Own sessions on the caller's engine: the flusher thread must never commit or roll back
+        # a request thread's session mid-transaction
+        self._sessions = sessionmaker(bind=db_session.get_bind())
+        self.mapper = mapper
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._rows = deque()
+        self._failed_flushes = 0
+        self.dropped_rows = 0
+        self._flush_requested = threading.Event()
+        self._flush_lock = threading.Lock()
+
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def append(self, row):
+        """Queue one row (a column -> value dict); a full batch wakes the flusher early"""
+        if len(self._rows) >= MAX_BUFFERED_ROWS:
+            self.dropped_rows += 1
+            if self.dropped_rows % self.batch_size == 1:  # don't log every row of a long outage
+                logger.error(f'{self.mapper.__name__} buffer full; {self.dropped_rows} rows dropped so far')
+            return
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Write every buffered row in a single bulk insert; returns the row count"""
+        with self._flush_lock:
+            rows = []
+            # popleft is atomic, so rows appended mid-drain simply land in the next batch
+            while self._rows:
+                rows.append(self._rows.popleft())
+
+            if not rows:
+                return 0
+
+            with self._sessions() as session:
+                try:
+                    session.bulk_insert_mappings(self.mapper, rows)
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    self._failed_flushes += 1
+                    if self._failed_flushes < MAX_FLUSH_RETRIES:
+                        # Back to the front, ahead of anything appended meanwhile, for the next flush
+                        self._rows.extendleft(reversed(rows))
+                        logger.exception(f'Failed to flush {len(rows)} buffered {self.mapper.__name__} rows; will retry')
+                    else:
+                        self._failed_flushes = 0
+                        self.dropped_rows += len(rows)
+                        logger.exception(f'Dropped {len(rows)} buffered {self.mapper.__name__} rows after {MAX_FLUSH_RETRIES} failed flushes')
+                    return 0
+            self._failed_flushes = 0
+            return len(rows)
+
+    def stats(self):
+        """Buffered and dropped row counts, for health reporting"""
+        return {'buffered_rows': len(self._rows), 'dropped_rows': self.dropped_rows}
+
+    def _flush_loop(self):
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+
+_buffers = {}
+_buffers_lock = threading.Lock()
+
+def get_row_buffer(db_session, mapper):
+    """Shared buffer per (engine, mapper) so short-lived trackers and monitors don't each spawn a flusher"""
+    key = (db_session.get_bind(), mapper)
+    with _buffers_lock:
+        buffer = _buffers.get(key)
+        if buffer is None:
+            buffer = _buffers[key] = RowBuffer(db_session, mapper)
+        return buffer
@@ -1,13 +1,39 @@
+import os
+
 from flask import Flask, jsonify
 from flask_cors import CORS
 
 app = Flask(__name__)
+app.json.sort_keys = False
+app.json.compact = True
 CORS(app)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({"status": "healthy", "service": "AutoML Analytics Platform"})
 
+def _serve_production(host, port):
+    """Run under gunicorn with threaded workers (same as `gunicorn -w 4 -k gthread --threads 8 test_app:app`)"""
+    from gunicorn.app.base import BaseApplication
+
+    class _StandaloneApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', int(os.environ.get('GUNICORN_WORKERS', 4)))
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', int(os.environ.get('GUNICORN_THREADS', 8)))
+
+        def load(self):
+            return app
+
+    _StandaloneApplication().run()
+
 if __name__ == '__main__':
     print("Starting minimal Flask app...")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    port = int(os.environ.get('PORT', 5000))
+    host = os.environ.get('HOST', '0.0.0.0')
+
+    if os.environ.get('FLASK_ENV') == 'production':
+        _serve_production(host, port)
+    else:
+        app.run(debug=True, host=host, port=port, threaded=True)
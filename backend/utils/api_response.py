@@ -1,16 +1,28 @@
 from flask import jsonify, g
 from datetime import datetime
 from typing import Any, Dict, Optional
+from utils.json_provider import make_json_response
+
+def _request_timestamp():
+    """ISO timestamp computed once per request and reused by every response helper"""
+    if not g:
+        return datetime.utcnow().isoformat()
+    timestamp = g.get('request_ts_iso')
+    if timestamp is None:
+        timestamp = g.request_ts_iso = datetime.utcnow().isoformat()
+    return timestamp
+
+# Envelope skeletons copied per response; copying a presized dict beats rebuilding it key by key
+_SUCCESS_TEMPLATE = {'success': True, 'timestamp': None, 'correlation_id': None}
+_ERROR_TEMPLATE = {'message': None, 'code': None, 'timestamp': None, 'correlation_id': None}
 
 class APIResponse:
     @staticmethod
     def success(data: Any = None, message: str = None, status_code: int = 200):
         """Standard success response"""
-        response = {
-            'success': True,
-            'timestamp': datetime.utcnow().isoformat(),
-            'correlation_id': getattr(g, 'correlation_id', None)
-        }
+        response = _SUCCESS_TEMPLATE.copy()
+        response['timestamp'] = _request_timestamp()
+        response['correlation_id'] = getattr(g, 'correlation_id', None)
         
         if data is not None:
             response['data'] = data
@@ -24,25 +36,26 @@ class APIResponse:
     def error(message: str, error_code: str = 'GENERIC_ERROR', 
               details: Dict = None, status_code: int = 400):
         """Standard error response"""
-        response = {
-            'success': False,
-            'error': {
-                'message': message,
-                'code': error_code,
-                'timestamp': datetime.utcnow().isoformat(),
-                'correlation_id': getattr(g, 'correlation_id', None)
-            }
-        }
+        error_body = _ERROR_TEMPLATE.copy()
+        error_body['message'] = message
+        error_body['code'] = error_code
+        error_body['timestamp'] = _request_timestamp()
+        error_body['correlation_id'] = getattr(g, 'correlation_id', None)
         
         if details:
-            response['error']['details'] = details
+            error_body['details'] = details
+        
+        response = {'success': False, 'error': error_body}
         
         return jsonify(response), status_code
     
     @staticmethod
     def paginated(data: list, page: int, per_page: int, total: int):
-        """Paginated response format"""
-        return APIResponse.success({
+        """Paginated response format; item lists can be large, so serialize with orjson directly"""
+        response = _SUCCESS_TEMPLATE.copy()
+        response['timestamp'] = _request_timestamp()
+        response['correlation_id'] = getattr(g, 'correlation_id', None)
+        response['data'] = {
             'items': data,
             'pagination': {
                 'page': page,
@@ -50,7 +63,8 @@ class APIResponse:
                 'total': total,
                 'pages': (total + per_page - 1) // per_page
             }
-        })
+        }
+        return make_json_response(response), 200
     
     @staticmethod
     def job_status(job_id: str, status: str, progress: int = None, 
@@ -1,17 +1,45 @@
 # Utility functions and helpers
 import os
+import pandas as pd
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype
 from werkzeug.utils import secure_filename
 
+ALLOWED_EXTENSIONS = frozenset(('csv', 'xlsx', 'xls'))
+
 def allowed_file(filename):
     """Check if uploaded file has allowed extension"""
-    ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
+
+COPY_BUFFER_SIZE = 1 << 20  # 1MB
+
+def _is_temporal(column):
+    if is_datetime64_any_dtype(column):
+        return True
+    return column.dtype == object and infer_dtype(column, skipna=True) in ('date', 'time')
+
+def read_csv_fast(filepath):
+    """Load a CSV with the multi-threaded Arrow reader, falling back to the C parser
+
+    Arrow infers date/time columns that the C parser (and prediction requests) keep as
+    strings, so those columns are re-read as text to keep training and serving aligned.
+    """
+    try:
+        df = pd.read_csv(filepath, engine='pyarrow')
+    except Exception:
+        return pd.read_csv(filepath)
+    
+    temporal_cols = [col for col in df.columns if _is_temporal(df[col])]
+    if temporal_cols:
+        raw = pd.read_csv(filepath, usecols=temporal_cols, dtype=str)
+        df[temporal_cols] = raw[temporal_cols]
+    return df
 
 def save_uploaded_file(file, upload_folder):
     """Safely save uploaded file"""
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
         filepath = os.path.join(upload_folder, filename)
-        file.save(filepath)
+        file.save(filepath, buffer_size=COPY_BUFFER_SIZE)
         return filepath
     return None
\ No newline at end of file
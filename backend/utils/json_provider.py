@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _default(obj):
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, date):  # pandas Timestamp / NaT subclass datetime
+        return None if obj != obj else obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    if hasattr(obj, 'tolist'):  # pandas objects, object-dtype or non-contiguous ndarrays
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def dumps_bytes(obj, sort_keys=False, indent=False):
+    option = ORJSON_OPTIONS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_default, option=option)
+
+def make_json_response(payload, status_code=200):
+    """Serialize straight to a Response, skipping the jsonify machinery"""
+    return Response(dumps_bytes(payload), status=status_code, mimetype='application/json')
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson; same knobs as the default provider"""
+
+    sort_keys = True
+    compact = None
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent) + b'\n',
+            mimetype=self.mimetype
+        )
@@ -1,24 +1,59 @@
 import os
+import atexit
+import queue
 import psutil
 import tempfile
 import shutil
 from contextlib import contextmanager
-from datetime import datetime, timedelta
 import threading
 import time
 
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:  # same semantics, slower uncontended path
+    _RLock = threading.RLock
+
+MEMORY_POLL_INTERVAL = 0.25  # seconds; RSS readings younger than this are reused
+TEMP_FILE_MAX_AGE = 3600  # seconds before the periodic sweep reclaims a tracked temp path
+TEMP_ALLOC_CONCURRENCY = min(32, (os.cpu_count() or 1) * 2)  # threads allowed into temp allocation at once
+
 class ResourceManager:
     def __init__(self, max_memory_mb=1024, cleanup_interval=3600):
         self.max_memory_mb = max_memory_mb
+        self._process = psutil.Process()
+        self._last_memory = (float('-inf'), 0.0)  # (monotonic time, RSS in MB)
         self.cleanup_interval = cleanup_interval
-        self.temp_files = set()
-        self.lock = threading.Lock()
+        self.temp_files = {}  # path -> (created_at, is_dir)
+        # Guards temp_files only; filesystem calls are always made outside it
+        self.lock = _RLock()
+        # Caps how many threads contend for the lock while allocating temp paths
+        self._admission = threading.Semaphore(TEMP_ALLOC_CONCURRENCY)
+        
+        # Temp files land in one directory; unlinking relative to an open fd skips the path walk
+        self._temp_dir = tempfile.gettempdir()
+        self._temp_dir_fd = None
+        if os.unlink in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY'):
+            try:
+                self._temp_dir_fd = os.open(self._temp_dir, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                pass
+        
+        # Removals requested by the context managers run here, off the request thread
+        self._cleanup_queue = queue.SimpleQueue()
+        threading.Thread(target=self._drain_cleanup_queue, daemon=True).start()
+        atexit.register(self._flush_cleanup_queue)
+        
+        self._stop_cleanup = threading.Event()
         self._start_cleanup_thread()
     
     def check_memory_usage(self):
         """Check if memory usage is within limits"""
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
+        checked_at, memory_mb = self._last_memory
+        now = time.monotonic()
+        if now - checked_at >= MEMORY_POLL_INTERVAL:
+            with self._process.oneshot():
+                memory_mb = self._process.memory_info().rss / 1024 / 1024
+            self._last_memory = (now, memory_mb)
         
         if memory_mb > self.max_memory_mb:
             raise MemoryError(f"Memory usage ({memory_mb:.1f}MB) exceeds limit ({self.max_memory_mb}MB)")
@@ -28,89 +63,117 @@ class ResourceManager:
     @contextmanager
     def temp_file(self, suffix=None, prefix=None):
         """Context manager for temporary files with automatic cleanup"""
-        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+        with self._admission:
+            temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+            os.close(temp_fd)
+            with self.lock:
+                self.temp_files[temp_path] = (time.time(), False)
         
         try:
-            with self.lock:
-                self.temp_files.add(temp_path)
-            
-            os.close(temp_fd)
             yield temp_path
             
         finally:
-            self._cleanup_file(temp_path)
+            self._cleanup_queue.put((temp_path, False))
     
     @contextmanager
     def temp_directory(self, prefix=None):
         """Context manager for temporary directories"""
-        temp_dir = tempfile.mkdtemp(prefix=prefix)
+        with self._admission:
+            temp_dir = tempfile.mkdtemp(prefix=prefix)
+            with self.lock:
+                self.temp_files[temp_dir] = (time.time(), True)
         
         try:
-            with self.lock:
-                self.temp_files.add(temp_dir)
-            
             yield temp_dir
             
         finally:
-            self._cleanup_directory(temp_dir)
+            self._cleanup_queue.put((temp_dir, True))
+    
+    def _remove(self, path, is_dir):
+        if is_dir:
+            self._cleanup_directory(path)
+        else:
+            self._cleanup_file(path)
+    
+    def _drain_cleanup_queue(self):
+        """Single consumer for deferred temp-file removals"""
+        while True:
+            self._remove(*self._cleanup_queue.get())
+    
+    def _flush_cleanup_queue(self):
+        """Process anything still queued, e.g. at interpreter exit"""
+        while True:
+            try:
+                item = self._cleanup_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._remove(*item)
+    
+    def _unlink(self, file_path):
+        parent, name = os.path.split(file_path)
+        if self._temp_dir_fd is not None and parent == self._temp_dir:
+            os.unlink(name, dir_fd=self._temp_dir_fd)  # unlinkat(2)
+        else:
+            os.unlink(file_path)
+    
+    def _delete(self, path, is_dir):
+        """Remove a path from disk without touching the lock; False if it is still there"""
+        try:
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                self._unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return False
+        return True
     
     def _cleanup_file(self, file_path):
         """Clean up a single file"""
-        try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-            
+        if self._delete(file_path, False):
             with self.lock:
-                self.temp_files.discard(file_path)
-                
-        except OSError:
-            pass
+                self.temp_files.pop(file_path, None)
     
     def _cleanup_directory(self, dir_path):
         """Clean up a directory"""
-        try:
-            if os.path.exists(dir_path):
-                shutil.rmtree(dir_path)
-            
+        if self._delete(dir_path, True):
             with self.lock:
-                self.temp_files.discard(dir_path)
-                
-        except OSError:
-            pass
+                self.temp_files.pop(dir_path, None)
     
     def _start_cleanup_thread(self):
         """Start background cleanup thread"""
         def cleanup_loop():
-            while True:
-                time.sleep(self.cleanup_interval)
+            # Fixed monotonic deadlines: a slow sweep or late wakeup doesn't push later runs back
+            next_run = time.monotonic() + self.cleanup_interval
+            while not self._stop_cleanup.wait(max(0.0, next_run - time.monotonic())):
                 self._cleanup_old_files()
+                next_run += self.cleanup_interval
+                if next_run < time.monotonic():  # missed whole periods; don't burst to catch up
+                    next_run = time.monotonic() + self.cleanup_interval
         
         thread = threading.Thread(target=cleanup_loop, daemon=True)
         thread.start()
     
+    def stop(self):
+        """Stop the periodic cleanup thread"""
+        self._stop_cleanup.set()
+    
     def _cleanup_old_files(self):
         """Clean up old temporary files"""
-        cutoff_time = datetime.now() - timedelta(hours=1)
+        cutoff = time.time() - TEMP_FILE_MAX_AGE
         
+        # Ages come from the recorded creation times, so no stat calls; the lock only covers the snapshot
         with self.lock:
-            files_to_remove = []
-            
-            for file_path in self.temp_files:
-                try:
-                    if os.path.exists(file_path):
-                        stat = os.stat(file_path)
-                        if datetime.fromtimestamp(stat.st_mtime) < cutoff_time:
-                            files_to_remove.append(file_path)
-                    else:
-                        files_to_remove.append(file_path)
-                except OSError:
-                    files_to_remove.append(file_path)
-            
-            for file_path in files_to_remove:
-                if os.path.isdir(file_path):
-                    self._cleanup_directory(file_path)
-                else:
-                    self._cleanup_file(file_path)
+            expired = [(path, is_dir) for path, (created_at, is_dir) in self.temp_files.items()
+                       if created_at < cutoff]
+        
+        # Syscalls run unlocked; tracking is updated in one short critical section
+        removed = [path for path, is_dir in expired if self._delete(path, is_dir)]
+        if removed:
+            with self.lock:
+                for path in removed:
+                    self.temp_files.pop(path, None)
 
 # Global resource manager
 resource_manager = ResourceManager()
\ No newline at end of file